@@ -0,0 +1,116 @@
+##@package batch
+#This module converts many pex files into vector maps at once, for example every experiment of AD-EYE after the extractor changed.
+#Each pex file is extracted by main.extract_vector_map in a worker process and its csv files are written in its own folder,
+#named after the pex file. A summary of the time spent on each file and of the failures is written in the output folder.
+#
+#Usage: python batch.py "/home/adeye/AD-EYE_Core/AD-EYE/Experiments/*/Simulation/*.pex" -o ./csv_batch/ -j 4
+
+import argparse
+import contextlib
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+
+import main
+
+##This function returns the pex files given as paths, glob patterns or folders (searched recursively), sorted and without duplicates
+#@param patterns A list of strings. The paths, glob patterns or folders
+def find_pex_files(patterns):
+    pex_files = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, '**', '*.pex')
+        pex_files.update(os.path.abspath(path) for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    return sorted(pex_files)
+
+##This function returns the output folder of each pex file: a folder named after the pex file in the output folder.
+#Two pex files with the same name would overwrite each other's vector map, so they are rejected.
+#@param pex_files A list of strings. The paths to the pex files
+#@param output_folder A string. The folder where the folders of the vector maps are created
+def get_output_folders(pex_files, output_folder):
+    folders = {}
+    for pex_file in pex_files:
+        name = os.path.splitext(os.path.basename(pex_file))[0]
+        if name in folders:
+            raise ValueError("Two pex files are named " + name + ": " + folders[name][0] + " and " + pex_file)
+        folders[name] = (pex_file, os.path.join(output_folder, name))
+    return [folder for pex_file, folder in folders.values()]
+
+##This function extracts the vector map of one pex file. It is run in a worker process, and never raises an error
+#so that one failing pex file does not stop the others. What the extraction prints is written in a log file in the output folder.
+#@param job A tuple (pex_file, output_folder, use_prescan_speed)
+#@return A dictionary describing the extraction: the pex file, the output folder, the time in seconds and the error (None if it succeeded)
+def extract_file(job):
+    pex_file, output_folder, use_prescan_speed = job
+    result = {'pex_file': pex_file, 'output_folder': output_folder, 'time': 0.0, 'error': None}
+    t0 = time.perf_counter()
+    try:
+        os.makedirs(output_folder, exist_ok=True)
+        with open(os.path.join(output_folder, 'extraction.log'), 'w') as log:
+            with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+                try:
+                    if main.extract_vector_map(pex_file, output_folder, use_prescan_speed) is None:
+                        result['error'] = "The traffic lights could not be added to the vector map"
+                except Exception:
+                    traceback.print_exc()
+                    raise
+    except Exception as error:
+        result['error'] = type(error).__name__ + ": " + str(error)
+    result['time'] = time.perf_counter() - t0
+    return result
+
+##This function extracts the vector maps of many pex files with a pool of worker processes
+#@param pex_files A list of strings. The paths to the pex files
+#@param output_folder A string. The folder where the folder of each vector map and the summary are written
+#@param jobs An integer. The number of pex files extracted at the same time
+#@param use_prescan_speed A boolean. True to use the speeds of the pex files (see main.extract_vector_map)
+#@return The list of the results of extract_file, in the order of pex_files
+def extract_files(pex_files, output_folder, jobs=1, use_prescan_speed=True):
+    output_folders = get_output_folders(pex_files, output_folder)
+    job_list = [(pex_file, folder, use_prescan_speed) for pex_file, folder in zip(pex_files, output_folders)]
+    results = []
+    # Each worker only extracts one pex file, so the memory of a large map is given back before the next one
+    with multiprocessing.Pool(max(1, min(jobs, len(job_list))), maxtasksperchild=1) as pool:
+        for result in pool.imap_unordered(extract_file, job_list):
+            print(("FAILED " if result['error'] else "done   ") + "%7.1fs  " % result['time'] + result['pex_file'])
+            results.append(result)
+    results.sort(key=lambda result: pex_files.index(result['pex_file']))
+    return results
+
+##This function writes the summary of a batch in a json file and returns it
+#@param results The list of the results of extract_file
+#@param path A string. The path to the json file
+def write_summary(results, path):
+    summary = {'files': len(results),
+               'failures': sum(1 for result in results if result['error']),
+               'time': sum(result['time'] for result in results),
+               'results': results}
+    with open(path, 'w') as f:
+        json.dump(summary, f, indent=4)
+    return summary
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Extract the vector maps of many pex files.")
+    parser.add_argument('patterns', nargs='+', help="pex files, glob patterns or folders searched recursively for pex files")
+    parser.add_argument('-o', '--output', default='./csv_batch/', help="folder where a folder is created for the vector map of each pex file")
+    parser.add_argument('-j', '--jobs', type=int, default=max(1, multiprocessing.cpu_count() // 2), help="number of pex files extracted at the same time")
+    parser.add_argument('--default-speed', action='store_true', help="use the default speed of each road type instead of the speeds of the pex files")
+    arguments = parser.parse_args()
+
+    pex_files = find_pex_files(arguments.patterns)
+    if not pex_files:
+        sys.exit("No pex file found")
+    os.makedirs(arguments.output, exist_ok=True)
+    results = extract_files(pex_files, arguments.output, arguments.jobs, not arguments.default_speed)
+    summary = write_summary(results, os.path.join(arguments.output, 'summary.json'))
+    print(str(summary['files'] - summary['failures']) + " of " + str(summary['files']) + " pex files extracted in %.1fs" % summary['time'])
+    for result in results:
+        if result['error']:
+            print("  " + result['pex_file'] + ": " + result['error'])
+    if summary['failures']:
+        sys.exit(1)
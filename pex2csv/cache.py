@@ -0,0 +1,113 @@
+##@package cache
+#This module contains the cache in which the scenes read from pex files are stored on disk.
+#When the same pex file is extracted again, its road records, connections and traffic lights are loaded
+#from the cache instead of parsing the file.
+
+import gzip
+import hashlib
+import os
+import pickle
+import tempfile
+
+##A class that stores the scenes read from pex files in a folder.
+#Each entry is a compressed pickle named after the parser version and the hash of the content of the pex file,
+#so an entry is never used for a modified pex file or by another version of the parser.
+class SceneCache:
+    ##The constructor
+    #@param self The object pointer
+    #@param folder A string. The folder where the entries are stored, created if needed
+    #@param max_entries An integer. The number of entries kept in the folder, the least recently used ones are removed first
+    def __init__(self, folder, max_entries=8):
+        ##The folder where the entries are stored
+        self.folder = folder
+        ##The number of entries kept in the folder
+        self.max_entries = max_entries
+
+    ##This method returns the hash of the content of a file
+    #@param self The object pointer
+    #@param path A string. The path to the file
+    def hash(self, path):
+        content_hash = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                content_hash.update(block)
+        return content_hash.hexdigest()
+
+    ##This method returns the key of the entry of a pex file: the version of the parser followed by the hash of the file
+    #@param self The object pointer
+    #@param path A string. The path to the pex file
+    #@param version The version of the parser that reads the pex file
+    def key(self, path, version):
+        return 'v' + str(version) + '-' + self.hash(path)
+
+    ##This method returns the key of the roads extracted from a pex file by the previous run (see parse.update_roads).
+    #Unlike the key method, it does not depend on the content of the pex file, so the entry is found again after the file is modified.
+    #It depends on the version of the code building the roads, as the entry holds Road objects built by that code.
+    #@param self The object pointer
+    #@param path A string. The path to the pex file
+    #@param version The version of the parser that reads the pex file
+    #@param geometry A string. The version of the code building the roads (see parse.GEOMETRY_VERSION)
+    def roads_key(self, path, version, geometry):
+        return 'v' + str(version) + '-roads-' + geometry + '-' + hashlib.sha256(os.path.abspath(path).encode()).hexdigest()
+
+    ##This method returns what was stored under a key, or None if it is not in the cache
+    #@param self The object pointer
+    #@param key A string. The key of the entry, as returned by the key method
+    def load(self, key):
+        entry = os.path.join(self.folder, key + '.pkl.gz')
+        try:
+            with gzip.open(entry, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        except (AttributeError, ImportError): # stored by an older code whose classes or modules changed since
+            return None
+        try:
+            os.utime(entry) # Marks the entry as recently used
+        except FileNotFoundError: # removed by another run since it was read
+            pass
+        return data
+
+    ##This method stores what was read from a pex file under its key, then removes the entries that are not needed anymore
+    #@param self The object pointer
+    #@param key A string. The key of the entry, as returned by the key method
+    #@param data What was read from the pex file, it must be picklable
+    def store(self, key, data):
+        os.makedirs(self.folder, exist_ok=True)
+        entry = os.path.join(self.folder, key + '.pkl.gz')
+        # Each writer has its own temporary file, so two runs storing the same entry never write in the same file
+        with tempfile.NamedTemporaryFile(dir=self.folder, prefix=key + '-', suffix='.tmp', delete=False) as temporary:
+            try:
+                with gzip.open(temporary, 'wb') as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                temporary.close()
+                os.remove(temporary.name)
+                raise
+        os.replace(temporary.name, entry)
+        self.evict(key.split('-')[0])
+
+    ##This method removes the entries written by other versions of the parser
+    #and the least recently used entries above max_entries.
+    #Another run may remove the same entries at the same time, so the entries that are already gone are skipped.
+    #@param self The object pointer
+    #@param version A string. The version part of the keys in use
+    def evict(self, version):
+        entries = []
+        for name in os.listdir(self.folder):
+            if not name.endswith('.pkl.gz'):
+                continue
+            entry = os.path.join(self.folder, name)
+            try:
+                if not name.startswith(version + '-'):
+                    os.remove(entry)
+                else:
+                    entries.append((os.path.getmtime(entry), entry))
+            except FileNotFoundError:
+                pass
+        entries.sort(reverse=True)
+        for mtime, entry in entries[self.max_entries:]:
+            try:
+                os.remove(entry)
+            except FileNotFoundError:
+                pass
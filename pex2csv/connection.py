@@ -0,0 +1,46 @@
+##@package connection
+#This module contains the graph of the connections between the roads of the simulation.
+#In the pex file each Connection links a joint (an end) of a road to a joint of another road.
+
+##A class that stores, for each joint of each road, the joint of the road connected to it.
+class ConnectionGraph:
+    ##The constructor
+    #@param self The object pointer
+    def __init__(self):
+        ##A dictionary mapping a tuple (road id, joint id) to the tuple (peer road id, peer joint id) connected to it
+        self.joints = {}
+
+    ##This method adds a connection between two joints to the graph
+    #@param self The object pointer
+    #@param id_A A string. The id of the first road
+    #@param joint_A An integer. The id of the joint of the first road
+    #@param id_B A string. The id of the second road
+    #@param joint_B An integer. The id of the joint of the second road
+    def add_connection(self, id_A, joint_A, id_B, joint_B):
+        self.joints[(id_A, joint_A)] = (id_B, joint_B)
+        self.joints[(id_B, joint_B)] = (id_A, joint_A)
+
+    ##This method adds a Connection element of the pex file to the graph
+    #@param self The object pointer
+    #@param connection A Connection element (or a dictionary of its attributes)
+    def add_element(self, connection):
+        self.add_connection(connection.get('Road_A_UniqueId'), int(connection.get('Joint_A_Id')),
+                            connection.get('Road_B_UniqueId'), int(connection.get('Joint_B_Id')))
+
+    ##This method returns the tuple (peer road id, peer joint id) connected to a joint, or None if the joint is not connected
+    #@param self The object pointer
+    #@param id A string. The id of the road
+    #@param joint An integer. The id of the joint of the road
+    def get_peer(self, id, joint):
+        return self.joints.get((id, joint))
+
+    ##This method returns the id of the road connected to each joint of a road, 0 for the joints that are not connected
+    #@param self The object pointer
+    #@param id A string. The id of the road
+    #@param nbr_of_joints An integer. The number of joints of the road
+    def get_connected_roads(self, id, nbr_of_joints):
+        connected_roads = []
+        for joint in range(nbr_of_joints):
+            peer = self.get_peer(id, joint)
+            connected_roads.append(peer[0] if peer is not None else 0)
+        return connected_roads
@@ -1,7 +1,10 @@
 import numpy as np
+import os
 import sys
 
 import parse
+from cache import SceneCache
+from timing import ParserProfile
 from preproc import StaticObjectProcessor,RoadProcessor
 from vmap import VectorMap
 
@@ -12,55 +15,89 @@ VECTORMAP_FILES_FOLDER = "/home/adeye/AD-EYE_Core/Pex_Data_Extraction/pex2csv/cs
 OnlyVisualisation = False # True if you want to generate the visualisation of the files from VECTORMAP_FILES_FOLDER,
                          # False if if you want to create the vector map of PEX_FILE_LOCATION
 USE_PRESCAN_SPEED = True
+STREAMING_PARSER = False # True to read the pex file with a streaming parser, for very large experiments
+PARSER_JOBS = 1 # Number of processes building the roads, increase it to use several cores on large maps
+CACHE_FOLDER = "/home/adeye/AD-EYE_Core/Pex_Data_Extraction/pex2csv/cache/" # Where the parsed pex files are kept, None to disable the cache
+INCREMENTAL = False # True to only rebuild the roads that changed since the last run on the same pex file (needs CACHE_FOLDER)
+PARSER_PROFILE_FILE = None # Json file where the time spent reading and building each road type is written, None to disable it
+LANE_TOLERANCE = 0.0 # Largest distance (m) between a lane and its simplified version, 0 to keep every point of the lanes
+LANE_MAX_SPACING = 1.0 # Largest distance (m) between two points of a simplified lane. The lanes are sampled every meter, so only a larger
+                       # value removes points on the straights, for an export sparser than the 1 m spacing of the vector map format
 
-if OnlyVisualisation == False :
-    if __name__ == '__main__':
+##This function extracts the vector map of a pex file and writes it as csv files in a folder
+#@param pex_file A string. The path to the pex file
+#@param output_folder A string. The folder where the csv files are written
+#@param use_prescan_speed A boolean. True to use the speeds of the pex file, False to use the default speed of each road type
+#@param streaming A boolean. True to read the pex file with the streaming parser (see parse.load_scene)
+#@param jobs An integer. The number of processes building the roads (see parse.load_scene)
+#@param cache A SceneCache object (defined in the cache file) or None to always parse the pex file
+#@param incremental A boolean. True to only rebuild the roads that changed since the last run (see parse.load_scene)
+#@param profile A ParserProfile object (defined in the timing file) measuring the parser, or None
+#@param lane_tolerance A Float. The largest distance in meters between a lane and the lane made of the points kept, 0 to keep every point (see utils.resample_line)
+#@param lane_spacing A Float. The largest distance in meters between two points kept on a lane
+#@return The VectorMap object, or None if the traffic lights could not be added to the vector map
+def extract_vector_map(pex_file, output_folder, use_prescan_speed=True, streaming=False, jobs=1, cache=None, incremental=False, profile=None,
+                       lane_tolerance=0.0, lane_spacing=1.0):
+    print("-> Parsing pex file")
+    scene = parse.load_scene(path=pex_file, streaming=streaming, cache=cache, jobs=jobs, incremental=incremental, profile=profile)
+    roads = scene.roads
+    static_objects = scene.staticobject
 
-        print("-> Parsing pex file")
-        roads = parse.get_roads(path=PEX_FILE_LOCATION)
-        static_objects = parse.get_staticobject(path=PEX_FILE_LOCATION)
+    print("-> Processing parsed roads and objects")
+    roads_processor = RoadProcessor(roads, lane_tolerance, lane_spacing)
+    roads_processor.create_lanes()
+    static_objects_processor = StaticObjectProcessor()
+    static_objects_processor.add_staticobject(static_objects)
+    static_objects_processor.create_static_object()
 
-        print("-> Processing parsed roads and objects")
-        roads_processor = RoadProcessor(roads)
-        roads_processor.create_lanes()
-        static_objects_processor = StaticObjectProcessor()
-        static_objects_processor.add_staticobject(static_objects)
-        static_objects_processor.create_static_object()
+    print("-> Creating vector map components")
+    vector_map = VectorMap()
+    crosswalks = vector_map.make_Area(roads_processor.crosswalks)
+    for lane in roads_processor.lanes:
+        if use_prescan_speed:
+            vector_map.make_lane(crosswalks, lane.SpeedLimit, lane.RefSpeed, lane.get_lanes(), junction_end=lane.get_junction_end(), junction_start=lane.get_junction_start())
+        else:
+            vector_map.make_lane(crosswalks, lane.DefinedSpeed, lane.DefinedSpeed, lane.get_lanes(), junction_end=lane.get_junction_end(), junction_start=lane.get_junction_start())
+    # Commented out since centers and edges seem to crash autoware
+    # for edge in roads_processor.edges:
+    #     vector_map.make_line(edge.get_lanes(), line_type='EDGE')
+    #for center in roads_processor.centers:
+    #    vector_map.make_line(center.get_lanes(), line_type='CENTER')
+    vector_map.make_crosswalk(crosswalks)
+    vector_map.make_Stoplines(roads_processor.stoplines)
+    error = vector_map.make_TrafficLight(static_objects_processor.TrfLight)
+    if error == True :
+        return None
+
+
+    print("-> Merging points that are too close")
+    vector_map.merge_redundant_points()
+    print("-> Removing lanes with only one point")
+    vector_map.remove_one_point_lanes()
+    print("-> Rebuilding lanes connections")
+    vector_map.rebuild_lane_conections()
+    print("-> Writing csv files")
+    vector_map.export(os.path.join(output_folder, ''))
+    return vector_map
 
-        print("-> Creating vector map components")
-        vector_map = VectorMap()
-        crosswalks = vector_map.make_Area(roads_processor.crosswalks)
-        for lane in roads_processor.lanes:
-            if USE_PRESCAN_SPEED:
-                vector_map.make_lane(crosswalks, lane.SpeedLimit, lane.RefSpeed, lane.get_lanes(), junction_end=lane.get_junction_end(), junction_start=lane.get_junction_start())
-            else:
-                vector_map.make_lane(crosswalks, lane.DefinedSpeed, lane.DefinedSpeed, lane.get_lanes(), junction_end=lane.get_junction_end(), junction_start=lane.get_junction_start())
-        # Commented out since centers and edges seem to crash autoware
-        # for edge in roads_processor.edges:
-        #     vector_map.make_line(edge.get_lanes(), line_type='EDGE')
-        #for center in roads_processor.centers:
-        #    vector_map.make_line(center.get_lanes(), line_type='CENTER')
-        vector_map.make_crosswalk(crosswalks)
-        vector_map.make_Stoplines(roads_processor.stoplines)
-        error = vector_map.make_TrafficLight(static_objects_processor.TrfLight)
-        if error == True :
-            sys.exit()
 
+if __name__ == '__main__':
+    if OnlyVisualisation == False :
+        cache = SceneCache(CACHE_FOLDER) if CACHE_FOLDER else None
+        profile = ParserProfile(memory=True) if PARSER_PROFILE_FILE else None
+        vector_map = extract_vector_map(PEX_FILE_LOCATION, VECTORMAP_FILES_FOLDER, USE_PRESCAN_SPEED, STREAMING_PARSER, PARSER_JOBS, cache, INCREMENTAL, profile,
+                                          LANE_TOLERANCE, LANE_MAX_SPACING)
+        if profile is not None:
+            profile.stop()
+            profile.write(PARSER_PROFILE_FILE)
+        if vector_map is None :
+            sys.exit()
+        vector_map.plot()
 
-        print("-> Merging points that are too close")
+    else :
+        vector_map = VectorMap()
+        Files = [VECTORMAP_FILES_FOLDER+"point.csv",VECTORMAP_FILES_FOLDER+"lane.csv",VECTORMAP_FILES_FOLDER+"dtlane.csv"]
+        vector_map.readfiles(Files)
         vector_map.merge_redundant_points()
-        print("-> Removing lanes with only one point")
-        vector_map.remove_one_point_lanes()
-        print("-> Rebuilding lanes connections")
         vector_map.rebuild_lane_conections()
-        print("-> Writing csv files")
-        vector_map.export(VECTORMAP_FILES_FOLDER)
         vector_map.plot()
-
-else :
-    vector_map = VectorMap()
-    Files = [VECTORMAP_FILES_FOLDER+"point.csv",VECTORMAP_FILES_FOLDER+"lane.csv",VECTORMAP_FILES_FOLDER+"dtlane.csv"]
-    vector_map.readfiles(Files)
-    vector_map.merge_redundant_points()
-    vector_map.rebuild_lane_conections()
-    vector_map.plot()
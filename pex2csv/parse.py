@@ -5,97 +5,404 @@
 
 
 
+import bisect
+import copy
+import functools
+import hashlib
+import importlib
+import multiprocessing
+import pickle
+import re
 import numpy as np
 from lxml import etree
 
 from road import *
+from record import *
 from staticobject import *
-
-##This fonction fetches the list of traffic Light that make up the simulation in the pex file.
-#To do so, the fonction searches in the Actor part of the pex file, and then uses the id
-#of each traffic light to add them to a list using the get_X function define in this module.
+from connection import ConnectionGraph
+
+##The tags of the pex file needed to build the scene. Every other part of the file (sensors, trajectories...) is skipped.
+SCENE_TAGS = ('RoadSegment', 'Connection', 'Actor')
+##The version of the records read from the pex file. It must be increased whenever the content of the records
+#changes, so that the scenes stored in a cache by an older version are read again.
+PARSER_VERSION = 7
+##The modules whose code computes the geometry of the Road objects. The roads kept by the incremental mode (see update_roads)
+#are only valid for the code that built them, so they are stored under the hash of these modules (see geometry_version).
+#Any change of the geometry (the arc length tables of Curve, the lane arrays of Bend...) changes this hash, so the roads
+#stored before it are built again, without increasing PARSER_VERSION.
+GEOMETRY_MODULES = ('road', 'path', 'utils')
+##The key of the xsi:type attribute, which gives the type of the RoadSegments
+XSI_TYPE = '{http://www.w3.org/2001/XMLSchema-instance}type'
+##The registry of the road types, it maps the xsi:type of a RoadSegment to a tuple (reader, linked) (see register_road_type)
+ROAD_TYPES = {}
+##The registry of the actor types, it maps the type of an Actor to the function reading it (see register_actor_type)
+ACTOR_TYPES = {}
+##The patterns of the Description of an Actor that give its type, the first pattern found in the Description is used.
+#The traffic lights are the Actors whose Description contains 'Roadside' (TrafficLight_Roadside, Roadside_NL...).
+#'sign' and 'signs' are only matched as whole words whatever their case, a word ending at anything but a letter or a digit
+#(Sign_Stop, Stop sign...), so that "Design" or "signal" are not taken for a sign.
+ACTOR_KEYWORDS = ((re.compile(r'Roadside'), 'TrafficLight'),
+                  (re.compile(r'(?<![^\W_])signs?(?![^\W_])', re.IGNORECASE), 'TrafficSign'))
+
+##This function returns the hash of the source of modules. It changes whenever the code of one of the modules changes.
+#@param modules A list of strings. The names of the modules
+def geometry_version(modules=GEOMETRY_MODULES):
+    source_hash = hashlib.sha256()
+    for name in modules:
+        with open(importlib.import_module(name).__file__, 'rb') as f:
+            source_hash.update(f.read())
+    return source_hash.hexdigest()[:16]
+
+##The version of the geometry of the Road objects: the hash of the source of GEOMETRY_MODULES
+GEOMETRY_VERSION = geometry_version()
+
+##A class that gathers everything extracted from the pex file by load_scene.
+class Scene:
+    ##The constructor
+    #@param self The object pointer
+    #@param roads A dictionary of Road objects (defined in the road file) indexed by their id
+    #@param connections A ConnectionGraph object (defined in the connection file) linking the roads together
+    #@param staticobject A StaticObjectIndex object (defined in the staticobject file): the static objects indexed by their id and their type
+    def __init__(self, roads, connections, staticobject):
+        ##A dictionary of Road objects indexed by their id
+        self.roads = roads
+        ##A ConnectionGraph object linking the roads together
+        self.connections = connections
+        ##A StaticObjectIndex object, the dictionary of StaticObject objects indexed by their id and grouped by type
+        self.staticobject = staticobject
+
+##This generator walks through the pex file and yields the RoadSegment, Connection and Actor elements in the order of the file.
+#In streaming mode the file is read with etree.iterparse: only the subtrees of the yielded elements are kept in memory,
+#and each of them is cleared as soon as it has been used, along with every other part of the file.
+#@param path A string. This path points to the pex file
+#@param streaming A boolean. True to read the file with the streaming parser instead of loading the whole tree
+def iter_scene_elements(path, streaming=False):
+    if not streaming:
+        tree = etree.parse(path)
+        for element in tree.iter(*SCENE_TAGS):
+            yield element
+        return
+
+    depth = 0 # Number of scene elements currently opened
+    for event, element in etree.iterparse(path, events=('start', 'end')):
+        if element.tag in SCENE_TAGS:
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            yield element
+        elif event == 'start' or depth > 0:
+            continue
+        if depth == 0:
+            # The element is not needed anymore: free it and the siblings already read before it
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+##This fonction parses the pex file once and extracts everything needed to build the vector map.
+#The roads are found in the RoadSegment part of the pex file, the connections between them in the Connection part
+#and the static objects (traffic lights, signs...) in the Actor part. The roads are read into records using the read_X functions defined in this module.
 #@param path A string whith the './data/roads.pex' default value. This path points to the pex file
-def get_staticobject(path='./data/roads.pex'):
-
-    # eTree module fetch the Roads in the Pex file
-    ns = {'xsi': "http://www.w3.org/2001/XMLSchema-instance"}
-    tree = etree.parse(path)
-    staticobject_In_Simu = tree.findall('//Actor')
-    staticobject = {}
-
-    # For each Traffic Light in the simulation we produce a corresponding TrafficLight in the TrafLight list
+#@param streaming A boolean. True to read the file with a streaming parser, which keeps the memory used low on very large experiments
+#@param profile A ParserProfile object (defined in the timing file) measuring the reader of each road type, or None
+#@return A tuple (records, connections, staticobject) with the list of road records, the ConnectionGraph object and the StaticObjectIndex object
+def read_scene(path='./data/roads.pex', streaming=False, profile=None):
+
+    segment_origins = {}
+    connections = ConnectionGraph()
+    linked_segments = []
+    records = []
+    staticobject = StaticObjectIndex()
+
+    for element in iter_scene_elements(path, streaming):
+        id = element.get('id')
+
+        # For each Road Segment in the simulation produce the record of a road type
+        if (element.tag == 'RoadSegment'):
+            s = element
+            type = s.get(XSI_TYPE)
+            segment_origins.setdefault(id, (float(s[0].get('X')), float(s[0].get('Y'))))
+            if (type not in ROAD_TYPES):
+                continue
+            reader, linked = ROAD_TYPES[type]
+            if linked:
+                # Needs the roads connected to it: keep a copy of the segment and reserve its place in the record list
+                linked_segments.append((type, reader, id, copy.deepcopy(s), len(records)))
+                records.append(None)
+            else:
+                add_records(records, measure(profile, 'readers', type, reader, s, id))
+
+        elif (element.tag == 'Connection'):
+            connections.add_element(element)
+
+        # For each Actor of a registered type (traffic light, sign...) we produce the corresponding static object
+        elif (element.tag == 'Actor'):
+            type = get_actor_type(element)
+            if (type in ACTOR_TYPES):
+                staticobject.add(type, ACTOR_TYPES[type](element, id))
+
+    # The roads connected to others can be read now that every connection and road origin is known
+    for type, reader, id, s, index in reversed(linked_segments):
+        records[index:index + 1] = []
+        add_records(records, measure(profile, 'readers', type, reader, s, id, connections, segment_origins), index)
+
+    return records, connections, staticobject
+
+##This function registers the function reading the RoadSegments of a given type, so that load_scene can read them.
+#@param type A string. The xsi:type of the RoadSegments
+#@param reader The function reading a RoadSegment. It is called with the segment and its id and returns a record (see build_road)
+#or a list of records
+#@param linked A boolean. True if the reader also needs the ConnectionGraph and the dictionary of the origins of the road
+#segments, in which case it is called once every segment and connection of the pex file is known
+def register_road_type(type, reader, linked=False):
+    ROAD_TYPES[type] = (reader, linked)
+
+##This function calls a function, measuring it in a profile if one is given
+#@param profile A ParserProfile object (defined in the timing file) or None
+#@param step A string. The step of the parser the call belongs to (see ParserProfile.call)
+#@param name A string. What is measured in the step
+#@param function The function to call
+#@param args The parameters of the function
+def measure(profile, step, name, function, *args):
+    if profile is None:
+        return function(*args)
+    return profile.call(step, name, function, *args)
+
+##This function registers the function reading the Actors of a given type, so that load_scene can read them.
+#@param type A string. The type of the Actors, as given by get_actor_type
+#@param reader The function reading an Actor. It is called with the actor and its id and returns a StaticObject object
+def register_actor_type(type, reader):
+    ACTOR_TYPES[type] = reader
+
+##This function returns the type of an Actor, found from the words of its Description (see ACTOR_KEYWORDS), or None
+#@param actor An Actor element of the pex file
+def get_actor_type(actor):
+    description = actor.get('Description') or ''
+    for keyword, type in ACTOR_KEYWORDS:
+        if keyword.search(description):
+            return type
+    return None
+
+##This function adds what a reader returned to a list of records
+#@param records The list of records
+#@param result A record or a list of records
+#@param index An integer. The position where the records are inserted, None to add them at the end
+def add_records(records, result, index=None):
+    if not isinstance(result, list):
+        result = [result]
+    if index is None:
+        index = len(records)
+    records[index:index] = result
+
+##This function builds the Road object (defined in the road file) described by a road record.
+#@param record A RoadRecord object (defined in the record file) as returned by the read_X functions
+#@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+def build_road(record, lazy=False):
+    return record.build(lazy)
+
+##This function builds the Road objects described by a list of road records.
+#The roads can be built in parallel by a pool of processes, since each of them only depends on its own record.
+#@param records The list of road records (see build_road)
+#@param jobs An integer. The number of processes building the roads, 1 to build them in this process
+#@param lazy A boolean. True to compute the geometry of the roads only when it is first used (see Road.defer_geometry)
+#@param profile A ParserProfile object (defined in the timing file) measuring the build of each road class, or None.
+#The roads are then built in this process, whatever the number of jobs
+#@return A dictionary of Road objects indexed by their id, in the order of the records
+def build_roads(records, jobs=1, lazy=False, profile=None):
+    build = functools.partial(build_road, lazy=lazy)
+    if profile is not None:
+        built = [profile.call('builders', record.road_class.__name__, build, record) for record in records]
+    elif jobs > 1 and len(records) > 1 and not lazy:
+        with multiprocessing.Pool(min(jobs, len(records))) as pool:
+            built = pool.map(build, records, chunksize=1)
+    else:
+        built = map(build, records)
 
-    for t in staticobject_In_Simu:
-        description = t.get('Description')
+    roads = {}
+    for record, road in zip(records, built):
+        roads[record.id] = road
+    return roads
 
-        id = t.get('id')
-        if ('Roadside' in description):
-            staticobject[id] = get_TLight(t, id)
-    return staticobject
+##This function returns the fingerprint of a road record, a hash of all of its parameters.
+#Two records with the same fingerprint give the same Road object.
+#@param record A road record (see build_road)
+def record_fingerprint(record):
+    return hashlib.sha256(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+##This function builds the Road objects of a list of road records, reusing the roads built by a previous run.
+#Only the roads whose record changed (moved, edited or added) and the roads connected to them are built again,
+#every other road is taken from the previous run.
+#@param records The list of road records (see build_road)
+#@param connections A ConnectionGraph object (defined in the connection file) linking the roads together
+#@param previous A dictionary mapping the id of each road of the previous run to a tuple (fingerprint, Road object)
+#@param jobs An integer. The number of processes building the roads (see build_roads)
+#@param lazy A boolean. True to compute the geometry of the roads only when it is first used (see build_roads)
+#@param profile A ParserProfile object (defined in the timing file) or None (see build_roads)
+#@return A tuple (roads, manifest): the dictionary of Road objects indexed by their id, in the order of the records,
+#and the dictionary of tuples (fingerprint, Road object) to give as previous to the next run
+def update_roads(records, connections, previous, jobs=1, lazy=False, profile=None):
+    fingerprints = {}
+    changed = set()
+    for record in records:
+        id = record.id
+        fingerprints[id] = record_fingerprint(record)
+        if id not in previous or previous[id][0] != fingerprints[id]:
+            changed.add(id)
+    modified = set(changed)
+    for (id, joint), (peer, peer_joint) in connections.joints.items():
+        if peer in modified and id in fingerprints:
+            changed.add(id)
+
+    built = build_roads([record for record in records if record.id in changed], jobs, lazy, profile)
+    roads = {}
+    manifest = {}
+    for id in fingerprints:
+        roads[id] = built[id] if id in changed else previous[id][1]
+        manifest[id] = (fingerprints[id], roads[id])
+    return roads, manifest
+
+##This fonction extracts the scene of the pex file: its roads, the connections between them and its static objects.
+#The pex file is read with read_scene, then each road record is built into its Road object.
+#When a cache is given, the records of a pex file that was already read are taken from it instead of parsing the file again.
+#@param path A string whith the './data/roads.pex' default value. This path points to the pex file
+#@param streaming A boolean. True to read the file with a streaming parser, which keeps the memory used low on very large experiments
+#@param cache A SceneCache object (defined in the cache file) or None to always parse the pex file
+#@param jobs An integer. The number of processes building the roads (see build_roads)
+#@param lazy A boolean. True to compute the geometry of the roads only when it is first used, for tools that only need
+#the parameters of the roads (see Road.defer_geometry)
+#@param incremental A boolean. True to keep the roads in the cache and only build again, on the next run, the roads
+#that changed in the pex file since this run (see update_roads). The roads kept are only reused by the same version of the
+#geometry code (see GEOMETRY_VERSION). It has no effect without a cache
+#@param profile A ParserProfile object (defined in the timing file) to measure the time spent in each stage, each reader and
+#each road class, or None
+#@return A Scene object holding the roads, the connections and the static objects of the simulation
+def load_scene(path='./data/roads.pex', streaming=False, cache=None, jobs=1, lazy=False, incremental=False, profile=None):
+    records, connections, staticobject = measure(profile, 'stages', 'read', read_cached_scene, path, streaming, cache, profile)
+
+    if cache is not None and incremental:
+        roads_key = cache.roads_key(path, PARSER_VERSION, GEOMETRY_VERSION)
+        previous = cache.load(roads_key) or {}
+        roads, manifest = measure(profile, 'stages', 'build', update_roads, records, connections, previous, jobs, lazy, profile)
+        if [(id, manifest[id][0]) for id in manifest] != [(id, previous[id][0]) for id in previous]:
+            cache.store(roads_key, manifest)
+        return Scene(roads, connections, staticobject)
+    return Scene(measure(profile, 'stages', 'build', build_roads, records, jobs, lazy, profile), connections, staticobject)
+
+##This function returns what read_scene returns for a pex file, taking it from the cache when the file was already read
+#@param path A string. This path points to the pex file
+#@param streaming A boolean. True to read the file with the streaming parser (see load_scene)
+#@param cache A SceneCache object (defined in the cache file) or None to always parse the pex file
+#@param profile A ParserProfile object (defined in the timing file) or None
+def read_cached_scene(path, streaming=False, cache=None, profile=None):
+    scene = None
+    if cache is not None:
+        key = cache.key(path, PARSER_VERSION)
+        scene = cache.load(key)
+    if scene is None:
+        scene = read_scene(path, streaming, profile)
+        if cache is not None:
+            cache.store(key, scene)
+    return scene
+
+##This fonction fetches the static objects (traffic lights, signs...) that make up the simulation in the pex file.
+#It is a shortcut to the staticobject part of the scene, without building the roads.
+#@param path A string whith the './data/roads.pex' default value. This path points to the pex file
+#@param streaming A boolean. True to read the file with the streaming parser (see load_scene)
+#@param cache A SceneCache object (defined in the cache file) or None to always parse the pex file
+def get_staticobject(path='./data/roads.pex', streaming=False, cache=None):
+    return read_cached_scene(path, streaming, cache)[2]
 
 ##This fonction fetches the list of road that make up the simulation in the pex file.
-#To do so, the fonction searches in the RoadSegment part of the pex file, and then uses the id
-#of each road to add them to a list of Roads using the get_X function define in this module.
+#It is a shortcut to the roads part of the scene returned by load_scene.
 #@param path A string whith the './data/roads.pex' default value. this path points to the pex file
-def get_roads(path='./data/roads.pex'):
-
-    # eTree module fetch the Roads in the Pex file
-    ns = {'xsi': "http://www.w3.org/2001/XMLSchema-instance"}
-    tree = etree.parse(path)
-    segments = tree.findall('//RoadSegment')
-    connections = tree.findall('//Connection')
-    roads = {}
-
-    # For each Road Segment in the simulation produce a road type in the road list
-    for s in segments:
-        type = s.xpath('@xsi:type', namespaces = ns)[0]
-        id = s.get('id')
-        if (type == 'BendRoad'):
-            roads[id] = get_bend(s, id)
-        elif (type == 'BezierRoad'):
-            roads[id] = get_curved(s, id)
-        elif (type == 'StraightRoad'):
-            roads[id] = get_straight(s, id)
-        elif (type == 'Roundabout'):
-            roads[id] = get_roundabout(s, id, connections, path)
-        elif (type == 'XCrossing'):
-            roads[id] = get_xcross(s, id)
-        elif (type == 'EntryLaneRoad'):
-            roads[id] = get_entry(s, id)
-        elif (type == 'ExitLaneRoad'):
-            roads[id] = get_exit(s, id)
-        elif (type == 'LaneAdapterRoad'):
-            roads[id] = get_adapter(s, id)
-        elif (type == 'YCrossing'):
-            roads[id] = get_ycross(s, id)
-        elif (type == 'CubicSplineRoad'):
-            roads.update(get_flex(s, id))
-        elif (type == 'PedestrianCrossing'):
-            roads[id] = get_crosswalk(s, id)
-        elif (type == 'ClothoidRoad'):
-            roads[id] = get_clothoid(s, id, connections, path)
-    return roads
+#@param streaming A boolean. True to read the file with the streaming parser (see load_scene)
+#@param jobs An integer. The number of processes building the roads (see build_roads)
+#@param lazy A boolean. True to compute the geometry of the roads only when it is first used (see load_scene)
+#@param profile A ParserProfile object (defined in the timing file) to measure the parser, or None (see load_scene)
+def get_roads(path='./data/roads.pex', streaming=False, jobs=1, lazy=False, profile=None):
+    return load_scene(path, streaming, jobs=jobs, lazy=lazy, profile=profile).roads
 
     # The following fonctions are called by get_staticobject and return the static object with the right parameters define in staticobject.py corresponding to the static object id in the input. #
 
 ##This function returns a TrafficLight object (defined in the staticobject file) with the corresponding id
-#@param t A StaticObject object (defined in the staticobject file)
+#@param t An Actor element of the pex file
 #@param id A String. The id of the object.
-def get_TLight(t, id):
+def read_traffic_light(t, id):
     x0 = float(t[0].get('X'))
     y0 = float(t[0].get('Y'))
     h = float(t[1].get('Heading')) * np.pi / 180
     s = 1
     return TrafficLight(id, x0, y0, h, s)
 
+##This function returns a TrafficSign object (defined in the staticobject file) with the corresponding id
+#@param t An Actor element of the pex file
+#@param id A String. The id of the object.
+def read_traffic_sign(t, id):
+    x0 = float(t[0].get('X'))
+    y0 = float(t[0].get('Y'))
+    h = float(t[1].get('Heading')) * np.pi / 180
+    return TrafficSign(id, x0, y0, h, t.get('Description'))
+
 
 
     # The following fonctions are called by get_roads #
 
-##This function returns the BendRoad object defined in the road file corresponding to the id in the input.
+##This function reads the road markings of a road segment and returns its stoplines and crosswalks.
+#The attributes of all the markings are first collected into arrays, then every stopline and every crosswalk is
+#moved from the frame of the road to the frame of the simulation with a single rotation and translation.
+#@param RoadMarking The RoadMarkings element of the Road Segment
+#@param x0 A float. The x coordinate of the origin of the road
+#@param y0 A float. The y coordinate of the origin of the road
+#@param h A float. The heading of the road
+#@param lw A float. The width of the lanes, which is the length of the stoplines
+#@param nbr_of_lanes_stopped An integer. The number of lanes crossed by the stoplines
+#@param stopline_heading A boolean. True if the stoplines follow the heading of their marker, False if they are perpendicular to the road
+#@param stopline_marker A string. The markings whose id contains this string are read as stoplines
+#@return A tuple (Stl, cw) with the list of stoplines (x1, y1, x2, y2, x3, y3, nbr_of_lanes_stopped, lw) and the list of crosswalks [x1, y1, x2, y2, x3, y3]
+def read_road_markings(RoadMarking, x0, y0, h, lw, nbr_of_lanes_stopped, stopline_heading=True, stopline_marker='BitmapRoadMarker'):
+    stop = []       # (X, Y, Heading) of each stopline marker
+    walk = []       # (X, Y, Heading, CrossingLength, CrossingWidth) of each crosswalk marker
+    for R in RoadMarking:
+        marker = str(R.get('id'))
+        if stopline_marker in marker:
+            stop.append((float(R[0].get('X')), float(R[0].get('Y')), float(R[1].get('Heading')) if stopline_heading else 0))
+        if "PedestrianMarkingGeneric" in marker:
+            walk.append((float(R[0].get('X')), float(R[0].get('Y')), float(R[1].get('Heading')), float(R.get('CrossingLength')), float(R.get('CrossingWidth'))))
+
+    rotation = np.array([[np.cos(h), np.sin(h)], [-np.sin(h), np.cos(h)]])
+    origin = np.array([x0, y0])
+
+    Stl = []
+    if stop:
+        stop = np.array(stop)
+        hStop = stop[:, 2] * np.pi / 180 + h
+        center = stop[:, :2] @ rotation + origin
+        half = (lw / 2) * np.stack((-np.sin(hStop), np.cos(hStop)), axis=1)
+        points = np.hstack((center + half, center - half, center))
+        for p in points.tolist():
+            Stl.append(tuple(p) + (nbr_of_lanes_stopped, lw))
+
+    cw = []
+    if walk:
+        walk = np.array(walk)
+        hw = walk[:, 2] * np.pi / 180
+        cl = walk[:, 3] / 2
+        cwh = walk[:, 4]
+        side = np.stack((-cl * np.sin(hw), cl * np.cos(hw)), axis=1)       # Half the crossing length, across the road
+        width = np.stack((cwh * np.cos(hw), cwh * np.sin(hw)), axis=1)     # The crossing width, along the road
+        mirror = np.stack((cl * np.sin(hw), cl * np.cos(hw)), axis=1)
+        local = np.stack((walk[:, :2] + side, walk[:, :2] + width + side, walk[:, :2] + mirror), axis=1)
+        points = local @ rotation + origin
+        cw = points.reshape(len(walk), 6).tolist()
+
+    return Stl, cw
+
+##This function returns the record (defined in the record file) of the BendRoad object defined in the road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-def get_bend(s, id):
+def read_bend(s, id):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -106,37 +413,13 @@ def get_bend(s, id):
     nbr_of_lanes = int(s.get('NumberOfLanes'))
     lanes_in_x_dir = int(s.get('DirectionChangeAfterLane'))
     RoadMarking = s[16]
-    Stl = []
-    cw = []
-    for R in RoadMarking:
-        if "BitmapRoadMarker" in str(R.get('id')) :
-            hStop = float(R[1].get('Heading'))* np.pi / 180
-            x1 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 - (lw/2) * np.sin(hStop+h)
-            y1 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0 + (lw/2)*np.cos(hStop+h)
-            x2 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 + (lw/2) * np.sin(hStop+h)
-            y2 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0  - (lw/2) * np.cos(hStop+h)
-            x3 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0
-            y3 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0
-            Stl.append((x1, y1, x2, y2, x3, y3,nbr_of_lanes-lanes_in_x_dir,lw))
-        if "PedestrianMarkingGeneric" in str(R.get('id')) :
-            hw = float(R[1].get('Heading'))*np.pi/180
-            cl = float(R.get('CrossingLength'))
-            cwh = float(R.get('CrossingWidth'))
-            xl = float(R[0].get('X'))
-            yl = float(R[0].get('Y'))
-            x1 = x0 + (xl - (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y1 = y0 + (xl - (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            x2 = x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(h) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(h)
-            y2 = y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(h) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(h)
-            x3 = x0 + (xl + (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y3 = y0 + (xl + (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            cw.append([x1,y1,x2,y2,x3,y3])
-    return BendRoad(id, x0, y0, h, rh, clr, lw, nbr_of_lanes, lanes_in_x_dir, Vmax, Vmax, Stl, cw)
-
-##This function returns the CurvedRoad object defined in the road file corresponding to the id in the input.
+    Stl, cw = read_road_markings(RoadMarking, x0, y0, h, lw, nbr_of_lanes-lanes_in_x_dir)
+    return BendRecord(id, x0, y0, h, rh, clr, lw, nbr_of_lanes, lanes_in_x_dir, Vmax, Vmax, Stl, cw)
+
+##This function returns the record (defined in the record file) of the CurvedRoad object defined in the road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-def get_curved(s, id):
+def read_curved(s, id):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -150,37 +433,15 @@ def get_curved(s, id):
     nbr_of_lanes = int(s.get('NumberOfLanes'))
     lanes_in_x_dir = int(s.get('DirectionChangeAfterLane'))
     RoadMarking = s[16]
-    Stl = []
-    cw = []
-    for R in RoadMarking:
-        if "BitmapRoadMarker" in str(R.get('id')) :
-            hStop = float(R[1].get('Heading'))* np.pi / 180
-            x1 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 - (lw/2) * np.sin(hStop+h)
-            y1 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0 + (lw/2)*np.cos(hStop+h)
-            x2 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 + (lw/2) * np.sin(hStop+h)
-            y2 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0  - (lw/2) * np.cos(hStop+h)
-            x3 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0
-            y3 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0
-            Stl.append((x1, y1, x2, y2, x3, y3,nbr_of_lanes-lanes_in_x_dir,lw))
-        if "PedestrianMarkingGeneric" in str(R.get('id')) :
-            hw = float(R[1].get('Heading'))*np.pi/180
-            cl = float(R.get('CrossingLength'))
-            cwh = float(R.get('CrossingWidth'))
-            xl = float(R[0].get('X'))
-            yl = float(R[0].get('Y'))
-            x1 = x0 + (xl - (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y1 = y0 + (xl - (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            x2 = x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(h) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(h)
-            y2 = y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(h) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(h)
-            x3 = x0 + (xl + (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y3 = y0 + (xl + (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            cw.append([x1,y1,x2,y2,x3,y3])
-    return CurvedRoad(id, x0, y0, h, rh, cp1, cp2, dx, dy, lw, nbr_of_lanes, lanes_in_x_dir, Vmax, Vmax, Stl, cw)
-
-##This function returns the ClothoidRoads object defined in the road file corresponding to the id in the input.
+    Stl, cw = read_road_markings(RoadMarking, x0, y0, h, lw, nbr_of_lanes-lanes_in_x_dir)
+    return CurvedRecord(id, x0, y0, h, rh, cp1, cp2, dx, dy, lw, nbr_of_lanes, lanes_in_x_dir, Vmax, Vmax, Stl, cw)
+
+##This function returns the record (defined in the record file) of the ClothoidRoads object defined in the road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-def get_clothoid(s, id, connections, path):
+#@param connections The ConnectionGraph object (defined in the connection file) linking the roads together
+#@param segment_origins A dictionary mapping the id of each road segment to its origin point (built by load_scene)
+def read_clothoid(s, id, connections, segment_origins):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -189,8 +450,6 @@ def get_clothoid(s, id, connections, path):
     nbr_of_lanes = int(s.get('NumberOfLanes'))
     lanes_in_x_dir = int(s.get('DirectionChangeAfterLane'))
     RoadMarking = s[16]
-    Stl = []
-    cw = []
     ClothoidSection = s[20]
 
     C2 = float(ClothoidSection[0].get('R')) * float(ClothoidSection[0].get('L'))
@@ -207,50 +466,19 @@ def get_clothoid(s, id, connections, path):
     else :
         flipped = True
 
-    for R in RoadMarking:
-        if "BitmapRoadMarker" in str(R.get('id')) :
-            hStop = float(R[1].get('Heading'))* np.pi / 180
-            x1 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 - (lw/2) * np.sin(hStop+h)
-            y1 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0 + (lw/2)*np.cos(hStop+h)
-            x2 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 + (lw/2) * np.sin(hStop+h)
-            y2 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0  - (lw/2) * np.cos(hStop+h)
-            x3 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0
-            y3 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0
-            Stl.append((x1, y1, x2, y2, x3, y3,nbr_of_lanes-lanes_in_x_dir,lw))
-        if "PedestrianMarkingGeneric" in str(R.get('id')) :
-            hw = float(R[1].get('Heading'))*np.pi/180
-            cl = float(R.get('CrossingLength'))
-            cwh = float(R.get('CrossingWidth'))
-            xl = float(R[0].get('X'))
-            yl = float(R[0].get('Y'))
-            x1 = x0 + (xl - (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y1 = y0 + (xl - (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            x2 = x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(h) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(h)
-            y2 = y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(h) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(h)
-            x3 = x0 + (xl + (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y3 = y0 + (xl + (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            cw.append([x1,y1,x2,y2,x3,y3])
-
-    TabConnect = [0,0]
-    for connection in connections:
-        idA = connection.get('Road_A_UniqueId')
-        idB = connection.get('Road_B_UniqueId')
-        if (id in idA):
-
-            TabConnect[int(connection.get('Joint_A_Id'))] = idB
-        elif (id in idB):
-
-            TabConnect[int(connection.get('Joint_B_Id'))] = idA
+    Stl, cw = read_road_markings(RoadMarking, x0, y0, h, lw, nbr_of_lanes-lanes_in_x_dir)
+
+    TabConnect = connections.get_connected_roads(id, 2)
     Tabpointcon = []
     for i in range(len(TabConnect)):
-        Tabpointcon.append(get_links_points_roundabout(TabConnect[i],path))
+        Tabpointcon.append(get_links_points_roundabout(TabConnect[i],segment_origins))
 
-    return ClothoidRoads(id, x0, y0, h, C2, Lstart, Lend, flipped, lw, nbr_of_lanes, lanes_in_x_dir, Tabpointcon, Vmax, Vmax, cw, Stl)
+    return ClothoidRecord(id, x0, y0, h, C2, Lstart, Lend, flipped, lw, nbr_of_lanes, lanes_in_x_dir, Tabpointcon, Vmax, Vmax, cw, Stl)
 
-##This function returns a flex road, which is a dictionary made of several CurvedRoad objects
+##This function returns a flex road, which is a list of records (see build_road) of several CurvedRoad objects
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-def get_flex(s, id): 
+def read_flex(s, id):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -266,37 +494,13 @@ def get_flex(s, id):
 
 
     RoadMarking = s[16]
-    Stl = []
     Lid = []
     Lx = []
     Ly = []
     LBt = []
     LFt = []
     Lh = []
-    cw = []
-    for R in RoadMarking:
-        if "BitmapRoadMarker" in str(R.get('id')) :
-            hStop = float(R[1].get('Heading'))* np.pi / 180
-            x1 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 - (lw/2) * np.sin(hStop+h)
-            y1 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0 + (lw/2)*np.cos(hStop+h)
-            x2 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 + (lw/2) * np.sin(hStop+h)
-            y2 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0  - (lw/2) * np.cos(hStop+h)
-            x3 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0
-            y3 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0
-            Stl.append((x1, y1, x2, y2, x3, y3,nbr_of_lanes-lanes_in_x_dir,lw))
-        if "PedestrianMarkingGeneric" in str(R.get('id')) :
-            hw = float(R[1].get('Heading'))*np.pi/180
-            cl = float(R.get('CrossingLength'))
-            cwh = float(R.get('CrossingWidth'))
-            xl = float(R[0].get('X'))
-            yl = float(R[0].get('Y'))
-            x1 = x0 + (xl - (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y1 = y0 + (xl - (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            x2 = x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(h) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(h)
-            y2 = y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(h) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(h)
-            x3 = x0 + (xl + (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y3 = y0 + (xl + (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            cw.append([x1,y1,x2,y2,x3,y3])
+    Stl, cw = read_road_markings(RoadMarking, x0, y0, h, lw, nbr_of_lanes-lanes_in_x_dir)
 
 
     Lid.append(id)
@@ -307,9 +511,8 @@ def get_flex(s, id):
     Lh.append(0)
     i = 0
     CrossSections = s[20] #.findall('//RoadCrossSection')
-    ns = {'xsi': "http://www.w3.org/2001/XMLSchema-instance"}
     for c in CrossSections: # here we find each curve of the flexible road (to create several flexible roads)
-        type = c.xpath('@xsi:type', namespaces=ns)[0]
+        type = c.get(XSI_TYPE)
         if type == 'CubicSplineCrossSection':
             i = i + 1
             Lid.append(c.get('id'))
@@ -326,14 +529,11 @@ def get_flex(s, id):
     LFt.append(cp1)
     Lh.append(rh)
 
-    CurvedRoads = {}
+    CurvedRoads = []
     X = []
     Y = []
-    cwj = []
-    Stlj = []
-    for j in range (i+1): # here we detect on which curved roads are the crosswalks and the stoplines
-        cwj_local  = []
-        Stlj_local = []
+    boxes = []
+    for j in range (i+1): # here we find the bounding box of each curved road, to detect on which one are the crosswalks and the stoplines
         (xCR,yCR) = (x0 + Lx[j] * np.cos(h) - Ly[j] * np.sin(h), y0 + Lx[j] * np.sin(h) + Ly[j] * np.cos(h))
         X.append(xCR)
         Y.append(yCR)
@@ -344,55 +544,53 @@ def get_flex(s, id):
             rhj = Lh[j + 1] - Lh[j]
             (p1x,p1y) = (X[j-1] + cp1j*np.cos(hj),Y[j-1] - cp1j*np.sin(hj))
             (p2x,p2y) = (X[j] + cp2j*np.cos(hj + rhj),Y[j] - cp2*np.sin(hj+rhj))
-            k=0
-            while k < (len(cw)):
-                xc = (cw[k][2]+cw[k][4])/2
-                yc = (cw[k][3]+cw[k][5])/2
-                if ( min(X[j-1],X[j],p1x,p2x) <= xc < max(X[j-1],X[j],p1x,p2x) ) and ( min(Y[j-1],Y[j],p1y,p2y) <= yc < max(Y[j-1],Y[j],p1y,p2y) ) :
-                    cwj_local.append(cw.pop(k))
-                else : k+=1
-            k=0
-            while k < (len(Stl)):
-                if ( min(X[j-1],X[j],p1x,p2x) <= Stl[k][4] < max(X[j-1],X[j],p1x,p2x) ) and ( min(Y[j-1],Y[j],p1y,p2y) <= Stl[k][5] < max(Y[j-1],Y[j],p1y,p2y) ) :
-                    Stlj_local.append(Stl.pop(k))
-                else : k+=1
-
-            cwj.append(cwj_local)
-            Stlj.append(Stlj_local)
-    k=0
-    cwj_local  = []
-    Stlj_local = []
-    while k < (len(cw)):
-        cwj_local.append(cw.pop(k))
-    while k < (len(Stl)):
-        Stlj_local.append(Stl.pop(k))
-    cwj.append(cwj_local)
-    Stlj.append(Stlj_local)
-
-
-    for j in range(i+1): # Now we create the curved roads
-
-        NewCurvedRoad = CurvedRoad(Lid[j],
-                                   x0 + Lx[j] * np.cos(h) - Ly[j] * np.sin(h),
-                                   y0 + Lx[j] * np.sin(h) + Ly[j] * np.cos(h),
+            boxes.append((min(X[j-1],X[j],p1x,p2x), max(X[j-1],X[j],p1x,p2x), min(Y[j-1],Y[j],p1y,p2y), max(Y[j-1],Y[j],p1y,p2y)))
+
+    # The markings found in none of the boxes are given to the last curved road
+    cwj = [[cw[k] for k in bucket] for bucket in bucket_markings([((c[2]+c[4])/2, (c[3]+c[5])/2) for c in cw], boxes)]
+    Stlj = [[Stl[k] for k in bucket] for bucket in bucket_markings([(c[4], c[5]) for c in Stl], boxes)]
+
+
+    for j in range(i+1): # Now we create the records of the curved roads
+
+        CurvedRoads.append(CurvedRecord(Lid[j], X[j], Y[j],
                                    Lh[j] + h,
                                    Lh[j + 1] - Lh[j], LFt[j], LBt[j + 1],
                                    (Lx[j + 1] - Lx[j]) * np.cos(-Lh[j]) - (Ly[j + 1] - Ly[j]) * np.sin(-Lh[j]),
                                    (Lx[j + 1] - Lx[j]) * np.sin(-Lh[j]) + (Ly[j + 1] - Ly[j]) * np.cos(-Lh[j]),
-                                   lw, nbr_of_lanes, lanes_in_x_dir, Vmax, Vmax, Stlj[j], cwj[j])
-
-        CurvedRoads[Lid[j]] = NewCurvedRoad
+                                   lw, nbr_of_lanes, lanes_in_x_dir, Vmax, Vmax, Stlj[j], cwj[j]))
     return CurvedRoads
 
 
 
-##This function returns the RoundaboutRoad object defined in the Road file corresponding to the id in the input.
+##This function finds, for each bounding box, the points that are inside it. The points are sorted along x once,
+#so the points of a box are found by bisection instead of testing every point against every box.
+#@param points A list of points (x, y), one per marking
+#@param boxes A list of bounding boxes (xmin, xmax, ymin, ymax). The lower bounds are included, the upper bounds are not
+#@return A list with, for each box, the indices of the points inside it in increasing order, followed by the indices
+#of the points left in none of the boxes. A point inside several boxes only belongs to the first one
+def bucket_markings(points, boxes):
+    order = sorted(range(len(points)), key=lambda k: points[k][0])
+    xs = [points[k][0] for k in order]
+    claimed = [False] * len(points)
+    buckets = []
+    for (xmin, xmax, ymin, ymax) in boxes:
+        bucket = []
+        for k in order[bisect.bisect_left(xs, xmin):bisect.bisect_left(xs, xmax)]:
+            if not claimed[k] and ymin <= points[k][1] < ymax:
+                claimed[k] = True
+                bucket.append(k)
+        buckets.append(sorted(bucket))
+    buckets.append([k for k in range(len(points)) if not claimed[k]])
+    return buckets
+
+##This function returns the record (defined in the record file) of the RoundaboutRoad object defined in the Road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-#@param connections The list of connections to other roads
-#@param path The path to the .pex file
+#@param connections The ConnectionGraph object (defined in the connection file) linking the roads together
+#@param segment_origins A dictionary mapping the id of each road segment to its origin point (built by load_scene)
 
-def get_roundabout(s, id, connections, path):
+def read_roundabout(s, id, connections, segment_origins):
     origin_x0 = float(s[0].get('X'))            # Origin X
     origin_y0 = float(s[0].get('Y'))            # Origin Y
     Vmax = s.get('MaxSpeed')                    # Maximum speed allowed for a  particular road
@@ -418,47 +616,20 @@ def get_roundabout(s, id, connections, path):
     # The following statements creates a pedestrian crosswalk.
     # First it checks whether for each cross section there is a marking represented by the term 'PedestrianMarkingGeneric'.
     # And if it is present, then it performs the math for calculating three points which represents crosswalk.  
-    cross_walk = []
-    for R in RoadMarking:
-        if "PedestrianMarkingGeneric" in str(R.get('id')) :
-            hw = float(R[1].get('Heading'))*np.pi/180
-            cl = float(R.get('CrossingLength'))
-            cwh = float(R.get('CrossingWidth'))
-            xl = float(R[0].get('X'))
-            yl = float(R[0].get('Y'))
-            x1 = origin_x0 + (xl - (cl/2)*np.sin(hw))*np.cos(heading) - (yl + (cl/2)*np.cos(hw))*np.sin(heading)
-            y1 = origin_y0 + (xl - (cl/2)*np.sin(hw))*np.sin(heading) + (yl + (cl/2)*np.cos(hw))*np.cos(heading)
-            x2 = origin_x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(heading) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(heading)
-            y2 = origin_y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(heading) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(heading)
-            x3 = origin_x0 + (xl + (cl/2)*np.sin(hw))*np.cos(heading) - (yl + (cl/2)*np.cos(hw))*np.sin(heading)
-            y3 = origin_y0 + (xl + (cl/2)*np.sin(hw))*np.sin(heading) + (yl + (cl/2)*np.cos(hw))*np.cos(heading)
-            cross_walk.append([x1,y1,x2,y2,x3,y3])
+    cross_walk = read_road_markings(RoadMarking, origin_x0, origin_y0, heading, lane_width, 0)[1]
     # Next we find out the mid cross section points for each crosssection.For that first we collect the information of the roads connected to the roundabout
-    connection_roads = [0,0,0,0]
-
-    for connection in connections:
-        
-        id_of_Road_A = connection.get('Road_A_UniqueId')
-        id_of_Road_B = connection.get('Road_B_UniqueId')
-        
-        if (id in id_of_Road_A):
-            
-            connection_roads[int(connection.get('Joint_A_Id'))] = id_of_Road_B
-            
-        elif (id in id_of_Road_B):
-            
-            connection_roads[int(connection.get('Joint_B_Id'))] = id_of_Road_A
+    connection_roads = connections.get_connected_roads(id, 4)
     # Then we calculate the mid cross section points for each cross section using the following math.
     mid_crosssection_points = []
     for i in range(len(connection_roads)):
-        mid_crosssection_points.append(get_links_points_roundabout(connection_roads[i],path))
+        mid_crosssection_points.append(get_links_points_roundabout(connection_roads[i],segment_origins))
         
-    return RoundaboutRoad(id, origin_x0, origin_y0, radius, lane_width, heading_of_crosssection, filletradius_of_crosssection, number_of_lanes_of_crosssection, number_of_lanes_in_xdirection_in_crosssection, number_of_lanes, Vmax, Vmax, mid_crosssection_points,road_end_marker_in_crosssection, cross_walk)
+    return RoundaboutRecord(id, origin_x0, origin_y0, radius, lane_width, heading_of_crosssection, filletradius_of_crosssection, number_of_lanes_of_crosssection, number_of_lanes_in_xdirection_in_crosssection, number_of_lanes, Vmax, Vmax, mid_crosssection_points,road_end_marker_in_crosssection, cross_walk)
 
-##This function returns the StraightRoad object defined in the Road file corresponding to the id in the input.
+##This function returns the record (defined in the record file) of the StraightRoad object defined in the Road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-def get_straight(s, id):
+def read_straight(s, id):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -469,36 +640,13 @@ def get_straight(s, id):
     lanes_in_x_dir = int(s.get('DirectionChangeAfterLane'))
     RoadMarking = s[16]
 
-    Stl = []
-    cw = []
-    for R in RoadMarking:
-        if "BitmapRoadMarker" in str(R.get('id')) :
-            x1 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 - (lw/2) * np.sin(h)
-            y1 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0 + (lw/2) * np.cos(h)
-            x2 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 + (lw*0.5) * np.sin(h)
-            y2 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0  - (lw*0.5) * np.cos(h)
-            x3 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0
-            y3 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0
-            Stl.append((x1, y1, x2, y2, x3, y3,nbr_of_lanes-lanes_in_x_dir,lw))
-        if "PedestrianMarkingGeneric" in str(R.get('id')) :
-            hw = float(R[1].get('Heading'))*np.pi/180
-            cl = float(R.get('CrossingLength'))
-            cwh = float(R.get('CrossingWidth'))
-            xl = float(R[0].get('X'))
-            yl = float(R[0].get('Y'))
-            x1 = x0 + (xl - (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y1 = y0 + (xl - (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            x2 = x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(h) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(h)
-            y2 = y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(h) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(h)
-            x3 = x0 + (xl + (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y3 = y0 + (xl + (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            cw.append([x1,y1,x2,y2,x3,y3])
-    return StraightRoad(id, x0, y0, h, l, lw, nbr_of_lanes, lanes_in_x_dir, Vmax, Vmax, Stl, cw)
-
-##This function returns the Crosswalkr object defined in the Road file corresponding to the id in the input.
+    Stl, cw = read_road_markings(RoadMarking, x0, y0, h, lw, nbr_of_lanes-lanes_in_x_dir, stopline_heading=False)
+    return StraightRecord(id, x0, y0, h, l, lw, nbr_of_lanes, lanes_in_x_dir, Vmax, Vmax, Stl, cw)
+
+##This function returns the record (defined in the record file) of the Crosswalkr object defined in the Road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-def get_crosswalk(s, id):
+def read_crosswalk(s, id):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -518,12 +666,12 @@ def get_crosswalk(s, id):
     y3 = y0 - (rw/2)*np.cos(h)
     cw.append([x1,y1,x2,y2,x3,y3])
 
-    return Crosswalkr(id, x0, y0, h, l, lw, nbr_of_lanes, lanes_in_x_dir, Vmax, Vmax, cw)
+    return CrosswalkRecord(id, x0, y0, h, l, lw, nbr_of_lanes, lanes_in_x_dir, Vmax, Vmax, cw)
 
-##This function returns the EntryRoad object defined in the Road file corresponding to the id in the input.
+##This function returns the record (defined in the record file) of the EntryRoad object defined in the Road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-def get_entry(s, id):
+def read_entry(s, id):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -536,39 +684,16 @@ def get_entry(s, id):
     apron_length=float(s.get('ApronLength'))
     side_road_length=float(s.get('SideRoadLength'))
     RoadMarking = s[16]
-    Stl = []
-    cw =[]
 
-    for R in RoadMarking:
-        if "BitmapRoadMarker" in str(R.get('id')) :
-            x1 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 - (lw/2) * np.sin(h)
-            y1 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0 + (lw/2) * np.cos(h)
-            x2 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 + (lw*0.5) * np.sin(h)
-            y2 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0  - (lw*0.5) * np.cos(h)
-            x3 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0
-            y3 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0
-            Stl.append((x1, y1, x2, y2, x3, y3,nbr_of_lanes-lanes_in_x_dir,lw))
-        if "PedestrianMarkingGeneric" in str(R.get('id')) :
-            hw = float(R[1].get('Heading'))*np.pi/180
-            cl = float(R.get('CrossingLength'))
-            cwh = float(R.get('CrossingWidth'))
-            xl = float(R[0].get('X'))
-            yl = float(R[0].get('Y'))
-            x1 = x0 + (xl - (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y1 = y0 + (xl - (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            x2 = x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(h) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(h)
-            y2 = y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(h) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(h)
-            x3 = x0 + (xl + (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y3 = y0 + (xl + (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            cw.append([x1,y1,x2,y2,x3,y3])
-
-
-    return EntryRoad(id, x0, y0, h, l, lw, nbr_of_lanes, lanes_in_x_dir, entry_road_angle, apron_length, side_road_length, Vmax, Vmax, Stl, cw)
-
-##This function returns the ExitRoad object defined in the Road file corresponding to the id in the input.
+    Stl, cw = read_road_markings(RoadMarking, x0, y0, h, lw, nbr_of_lanes-lanes_in_x_dir, stopline_heading=False)
+
+
+    return EntryRecord(id, x0, y0, h, l, lw, nbr_of_lanes, lanes_in_x_dir, entry_road_angle, apron_length, side_road_length, Vmax, Vmax, Stl, cw)
+
+##This function returns the record (defined in the record file) of the ExitRoad object defined in the Road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-def get_exit(s, id):
+def read_exit(s, id):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -582,36 +707,13 @@ def get_exit(s, id):
     side_road_length=float(s.get('SideRoadLength'))
     RoadMarking = s[16]
 
-    Stl = []
-    cw = []
-    for R in RoadMarking:
-        if "BitmapRoadMarker" in str(R.get('id')) :
-            x1 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 - (lw/2) * np.sin(h)
-            y1 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0 + (lw/2) * np.cos(h)
-            x2 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 + (lw*0.5) * np.sin(h)
-            y2 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0  - (lw*0.5) * np.cos(h)
-            x3 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0
-            y3 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0
-            Stl.append((x1, y1, x2, y2, x3, y3,nbr_of_lanes-lanes_in_x_dir,lw))
-        if "PedestrianMarkingGeneric" in str(R.get('id')) :
-            hw = float(R[1].get('Heading'))*np.pi/180
-            cl = float(R.get('CrossingLength'))
-            cwh = float(R.get('CrossingWidth'))
-            xl = float(R[0].get('X'))
-            yl = float(R[0].get('Y'))
-            x1 = x0 + (xl - (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y1 = y0 + (xl - (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            x2 = x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(h) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(h)
-            y2 = y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(h) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(h)
-            x3 = x0 + (xl + (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y3 = y0 + (xl + (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            cw.append([x1,y1,x2,y2,x3,y3])
-    return ExitRoad(id, x0, y0, h, l, lw, nbr_of_lanes, lanes_in_x_dir, exit_road_angle, apron_length, side_road_length, Vmax, Vmax, Stl, cw)
-
-##This function returns the AdapterRoad object defined in the Road file corresponding to the id in the input.
+    Stl, cw = read_road_markings(RoadMarking, x0, y0, h, lw, nbr_of_lanes-lanes_in_x_dir, stopline_heading=False)
+    return ExitRecord(id, x0, y0, h, l, lw, nbr_of_lanes, lanes_in_x_dir, exit_road_angle, apron_length, side_road_length, Vmax, Vmax, Stl, cw)
+
+##This function returns the record (defined in the record file) of the AdapterRoad object defined in the Road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-def get_adapter(s, id):
+def read_adapter(s, id):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -625,40 +727,19 @@ def get_adapter(s, id):
     RoadMarking = s[16]
     lane_offset = int(s.get('LaneOffset'))
 
-    Stl = []
-    cw = []
 
-    for R in RoadMarking:
-            x1 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 - (lw/2) * np.sin(h)
-            y1 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0 + (lw/2) * np.cos(h)
-            x2 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0 + (lw*0.5) * np.sin(h)
-            y2 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0  - (lw*0.5) * np.cos(h)
-            x3 = -float(R[0].get('Y'))*np.sin(h) + float(R[0].get('X'))*np.cos(h)  + x0
-            y3 = float(R[0].get('X'))*np.sin(h) + float(R[0].get('Y'))*np.cos(h) +y0
-            Stl.append((x1, y1, x2, y2, x3, y3,nbr_of_lanes_start-lanes_in_x_dir_start,lw))
-            if "PedestrianMarkingGeneric" in str(R.get('id')) :
-                hw = float(R[1].get('Heading'))*np.pi/180
-                cl = float(R.get('CrossingLength'))
-                cwh = float(R.get('CrossingWidth'))
-                xl = float(R[0].get('X'))
-                yl = float(R[0].get('Y'))
-                x1 = x0 + (xl - (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-                y1 = y0 + (xl - (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-                x2 = x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(h) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(h)
-                y2 = y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(h) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(h)
-                x3 = x0 + (xl + (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-                y3 = y0 + (xl + (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-                cw.append([x1,y1,x2,y2,x3,y3])
-    return AdapterRoad(id, x0, y0, h, l, lw, nbr_of_lanes_start, nbr_of_lanes_end, lanes_in_x_dir_start, lanes_in_x_dir_end, Vmax, Vmax, Stl, cw, lane_offset)
-
-
-
-
-##This function returns the XCrossRoad object defined in the Road file corresponding to the id in the input.
+    # Every marking of a lane adapter is read as a stopline
+    Stl, cw = read_road_markings(RoadMarking, x0, y0, h, lw, nbr_of_lanes_start-lanes_in_x_dir_start, stopline_heading=False, stopline_marker='')
+    return AdapterRecord(id, x0, y0, h, l, lw, nbr_of_lanes_start, nbr_of_lanes_end, lanes_in_x_dir_start, lanes_in_x_dir_end, Vmax, Vmax, Stl, cw, lane_offset)
+
+
+
+
+##This function returns the record (defined in the record file) of the XCrossRoad object defined in the Road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
 
-def get_xcross(s, id):
+def read_xcross(s, id):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -682,7 +763,6 @@ def get_xcross(s, id):
         cs_road_end_marker.append(str(c.get('RoadEndMarker')))           # Appending the values from .pex file
         
     Stl = []    # List for stoplines in  each crossection
-    cw = []     # List for the crosswalks
     # Calculation of stoplines: The following math is used for calculating the three points for a stopline. For each crossection we calculate x1,y1 and x2,y2
     # And we take the average of these three points as the third point. And append them into the list.
     # Before that we check whether the string value of RoadEndMArker is Solid,if it is None, then we dont need stopline for that particular crosssection.
@@ -701,28 +781,15 @@ def get_xcross(s, id):
                
                         #
 
-    for R in RoadMarking:
-        if "PedestrianMarkingGeneric" in str(R.get('id')) :
-            hw = float(R[1].get('Heading'))*np.pi/180
-            cl = float(R.get('CrossingLength'))
-            cwh = float(R.get('CrossingWidth'))
-            xl = float(R[0].get('X'))
-            yl = float(R[0].get('Y'))
-            x1 = x0 + (xl - (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y1 = y0 + (xl - (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            x2 = x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(h) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(h)
-            y2 = y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(h) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(h)
-            x3 = x0 + (xl + (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y3 = y0 + (xl + (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            cw.append([x1,y1,x2,y2,x3,y3])
+    cw = read_road_markings(RoadMarking, x0, y0, h, lw, 0)[1]
 
      
-    return XCrossRoad(id, x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_in_x_dir, cs_l, Vmax, Vmax, Stl, cw)
+    return XCrossRecord(id, x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_in_x_dir, cs_l, Vmax, Vmax, Stl, cw)
 
-##This function returns the YCrossRoad object defined in the Road file corresponding to the id in the input.
+##This function returns the record (defined in the record file) of the YCrossRoad object defined in the Road file corresponding to the id in the input.
 #@param s A Road Segment
 #@param id A string indicating the type of road studied
-def get_ycross(s, id):
+def read_ycross(s, id):
     x0 = float(s[0].get('X'))
     y0 = float(s[0].get('Y'))
     Vmax = s.get('MaxSpeed')
@@ -745,7 +812,6 @@ def get_ycross(s, id):
         cs_road_end_marker.append(str(c.get('RoadEndMarker')))
 
     Stl = []
-    cw = []
 
     for i in range(3):
         if cs_road_end_marker[i] == "Solid" :
@@ -757,44 +823,34 @@ def get_ycross(s, id):
             y3 = (y1+y2)/2
             Stl.append((x1, y1, x2, y2, x3, y3,cs_nbr_of_lanes[i]-cs_lanes_in_x_dir[i],lw))
 
-    for R in RoadMarking:
-        if "PedestrianMarkingGeneric" in str(R.get('id')) :
-            hw = float(R[1].get('Heading'))*np.pi/180
-            cl = float(R.get('CrossingLength'))
-            cwh = float(R.get('CrossingWidth'))
-            xl = float(R[0].get('X'))
-            yl = float(R[0].get('Y'))
-            x1 = x0 + (xl - (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y1 = y0 + (xl - (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            x2 = x0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.cos(h) - (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.sin(h)
-            y2 = y0 + (xl + cwh*np.cos(hw) -(cl/2)*np.sin(hw))*np.sin(h) + (yl + cwh*np.sin(hw) + (cl/2)*np.cos(hw))*np.cos(h)
-            x3 = x0 + (xl + (cl/2)*np.sin(hw))*np.cos(h) - (yl + (cl/2)*np.cos(hw))*np.sin(h)
-            y3 = y0 + (xl + (cl/2)*np.sin(hw))*np.sin(h) + (yl + (cl/2)*np.cos(hw))*np.cos(h)
-            cw.append([x1,y1,x2,y2,x3,y3])
-
-    return YCrossRoad(id, x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_in_x_dir, cs_l, Vmax, Vmax, Stl, cw)
+    cw = read_road_markings(RoadMarking, x0, y0, h, lw, 0)[1]
+
+    return YCrossRecord(id, x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_in_x_dir, cs_l, Vmax, Vmax, Stl, cw)
 
 ##This function finds the orign point of the roads connected to the crosssections of the roundabout
 #@param id A string. The id of the road type
-#@param path The path to the .pex file
-def get_links_points_roundabout(id,path):
-
-    # eTree module fetch the Roads in the Pex file
-    ns = {'xsi': "http://www.w3.org/2001/XMLSchema-instance"}
-    tree = etree.parse(path)
-    segments = tree.findall('//RoadSegment')
+#@param segment_origins A dictionary mapping the id of each road segment to its origin point (built by load_scene)
+def get_links_points_roundabout(id, segment_origins):
     point = []
+    if id in segment_origins:
+        point.append(segment_origins[id])
+    return point
 
 
-
-    for s in segments:
-        type = s.xpath('@xsi:type', namespaces = ns)[0]
-        idseg = s.get('id')
-        if (idseg == id):
-            x0 = float(s[0].get('X'))
-            y0 = float(s[0].get('Y'))
-            point.append((x0,y0))
-            break
-
-
-    return point
+# The road types read by this module
+register_road_type('BendRoad', read_bend)
+register_road_type('BezierRoad', read_curved)
+register_road_type('StraightRoad', read_straight)
+register_road_type('Roundabout', read_roundabout, linked=True)
+register_road_type('XCrossing', read_xcross)
+register_road_type('EntryLaneRoad', read_entry)
+register_road_type('ExitLaneRoad', read_exit)
+register_road_type('LaneAdapterRoad', read_adapter)
+register_road_type('YCrossing', read_ycross)
+register_road_type('CubicSplineRoad', read_flex)
+register_road_type('PedestrianCrossing', read_crosswalk)
+register_road_type('ClothoidRoad', read_clothoid, linked=True)
+
+# The actor types read by this module
+register_actor_type('TrafficLight', read_traffic_light)
+register_actor_type('TrafficSign', read_traffic_sign)
@@ -8,6 +8,11 @@
 import numpy as np
 import bezier
 
+from utils import dist, fresnel
+
+##The number of points per meter of the table used by Curve to find the parameter of the bezier curve at a given arc length
+ARC_LENGTH_TABLE_DENSITY = 16
+
 ##Class defining the iterable object used to define each useful geometry
 class Path:
 
@@ -48,6 +53,41 @@ class Path:
         self.t += self.dt
         return(ret)
 
+    ##A method to return the steps at which a new iteration evaluates the path, as a numpy array.
+    #The steps are summed one after the other like in __next__, and the end of the path is added when no step reaches it exactly.
+    #@param self The object pointer
+    #@param dt A Float. The step to use instead of the step of the path, None to use the step of the path
+    def steps(self, dt=None):
+        if dt is None:
+            dt = self.dt
+        n = int(self.t1 / dt) + 2
+        t = np.add.accumulate(np.concatenate(([0.0], np.full(n, dt))))
+        while t[-1] <= self.t1:
+            t = np.concatenate((t, t[-1] + np.add.accumulate(np.full(n, dt))))
+        t = t[t <= self.t1]
+        if t[-1] != self.t1:
+            t = np.append(t, self.t1 * self.smooth_factor)
+        return t
+
+    ##A method to return all the points of the path as a numpy array of shape (N, 2), the same points as a new iteration.
+    #Unlike an iteration, it does not change the state of the path.
+    #@param self The object pointer
+    def sample(self):
+        return np.array([self.eval(t) for t in self.steps()], dtype=float).reshape(-1, 2)
+
+    ##A method to return the lanes following the path at the given offsets, as a numpy array of shape (lanes, N, 2).
+    #The path and its unit normals are evaluated once at the same steps, and each lane is the path moved by its offset
+    #along the normals. A lane driving backwards is simply lanes[i][::-1], which does not copy the points.
+    #Only the paths that define a vectorized eval and a normal method (Straight and Bend) can be used.
+    #@param self The object pointer
+    #@param offsets A list of Floats. The offset of each lane to the left of the path
+    #@param dt A Float. The step of the lanes, None to use the step of the path
+    def sample_lanes(self, offsets, dt=None):
+        t = self.steps(dt)
+        points = np.column_stack(self.eval(t))
+        normals = np.column_stack(self.normal(t))
+        return points + np.asarray(offsets, dtype=float)[:, None, None] * normals
+
     ##A method to return the starting point of the path
     #@param self The object pointer
     def getstart(self):
@@ -89,7 +129,42 @@ class Bend(Path):
         return (self.x0 + self.r * np.cos(self.a0 + np.sign(self.da) * t),
                 self.y0 + self.r * np.sin(self.a0 + np.sign(self.da) * t))
 
-##This path is represented with an Euler Spiral
+    ##A method to obtain the unit vector normal to the path, on its left, at the step t. It points to the center of the circle when the path turns left.
+    #Returns a tuple (x, y) representing the vector
+    #@param self The object pointer
+    #@param t A Float or a numpy array of Floats. A step.
+    def normal(self, t):
+        return (-np.sign(self.da) * np.cos(self.a0 + np.sign(self.da) * t),
+                -np.sign(self.da) * np.sin(self.a0 + np.sign(self.da) * t))
+
+    ##A method to return the lanes following the bend at the given offsets (see Path.sample_lanes).
+    #The angular step is chosen for the outermost lane, so that the points of every lane are at most 1 meter apart.
+    #@param self The object pointer
+    #@param offsets A list of Floats. The offset of each lane to the left of the path
+    def sample_lanes(self, offsets):
+        radius = np.max(np.abs(self.r - np.sign(self.da) * np.asarray(offsets, dtype=float)))
+        return Path.sample_lanes(self, offsets, 1 / radius)
+
+    ##A method to return the index of the point of the bend closest to a given point, like a scan of all the points would.
+    #The step of the closest point is found from the polar angle of the point around the center of the circle, so only the
+    #points around that step and the two ends of the bend are compared. When two points are as close, the lowest index is returned.
+    #@param self The object pointer
+    #@param point A tuple (x, y). The point, which must not be the center of the circle
+    #@param points The points of the bend returned by sample(), so that they are not computed again
+    def closest_index(self, point, points):
+        last = len(points) - 1
+        t = np.sign(self.da) * (np.arctan2(point[1] - self.y0, point[0] - self.x0) - self.a0) % (2 * np.pi)
+        step = int(t / self.dt)
+        candidates = sorted({min(max(i, 0), last) for i in (0, step - 1, step, step + 1, step + 2, last)})
+        distances = [dist(points[i], point) for i in candidates]
+        return candidates[int(np.argmin(distances))]
+
+    ##A method to return all the points of the path as a numpy array of shape (N, 2), evaluated in one vectorized call (see Path.sample)
+    #@param self The object pointer
+    def sample(self):
+        return np.column_stack(self.eval(self.steps()))
+
+##This path is represented with an Euler Spiral. Its points are computed exactly with the Fresnel integrals.
 class Clothoid (Path):
 
     ##The constructor
@@ -116,26 +191,35 @@ class Clothoid (Path):
         self.Lstart = Lstart
         ##The curvilinear abscissa at the end point
         self.Lend = Lend
-        ##A list of points (float, float) defining the path
-        self.values = [(x0,y0)]
         ##An integer. 1 if we calculate the spiral in the x direction, -1 if it is the spiral in the reverse x direction
         self.dir = dir
         Path.__init__(self,self.dL,abs(Lend-Lstart))
 
-    ##A method to obtain the point at the curvilinear abscissa L.
+    ##A method to obtain the point at the curvilinear abscissa L from the starting point.
+    #The heading of the spiral at the abscissa L is h + (dir*L+Lstart)**2/(2*C2), so the point is given by the Fresnel integrals
+    #of the normalized abscissa w = (dir*L+Lstart)/sqrt(pi*|C2|).
     #Returns a tuple (x, y) representing the point
     #@param self The object pointer
-    #@param L A Float. The curvilinear abscissa
+    #@param L A Float or a numpy array of Floats. The curvilinear abscissa
     def eval(self, L):
-        index = len(self.values) -1
-        phi = (self.dir*L+self.Lstart)**2/(2*self.C2)
-        x = self.values[index][0] + self.dir*np.cos(phi + self.h)
-        y = self.values[index][1] + self.dir*np.sin(phi + self.h)
-        self.values.append((x,y))
-        return (self.values[index][0], self.values[index][1])
+        scale = np.sqrt(np.pi * abs(self.C2))
+        sign = np.sign(self.C2)
+        S0, C0 = fresnel(self.Lstart / scale)
+        S, C = fresnel((self.dir * np.asarray(L) + self.Lstart) / scale)
+        dC, dS = scale * (C - C0), sign * scale * (S - S0)
+        return (self.x0 + dC * np.cos(self.h) - dS * np.sin(self.h),
+                self.y0 + dC * np.sin(self.h) + dS * np.cos(self.h))
+
+    ##A method to return all the points of the path as a numpy array of shape (N, 2), evaluated in one vectorized call (see Path.sample)
+    #@param self The object pointer
+    def sample(self):
+        return np.column_stack(self.eval(self.steps()))
 
 
 ##This path is represented with a bezier curve.
+#The path is walked by arc length, with a step of 1 meter like the other paths, so its points are equally spaced in meters.
+#The parameter of the bezier curve at a given arc length is interpolated in a table of the arc length of the curve (with its offset),
+#computed once when the curve is created.
 class Curve(Path):
 
     ##The constructor
@@ -153,8 +237,12 @@ class Curve(Path):
         nodes = np.asfortranarray([xs, ys])
         ##A bezier.Curve object created with the points stored in xs and ys
         self.c = bezier.Curve(nodes, degree = 3)
-        dt = 1.0 / self.c.length
-        Path.__init__(self, dt, 1.0)
+        ##A numpy array. The parameters of the bezier curve in the arc length table, from 0 to 1
+        self.table_t = np.linspace(0.0, 1.0, int(np.ceil(self.c.length * ARC_LENGTH_TABLE_DENSITY)) + 2)
+        x, y = self.eval_bezier(self.table_t)
+        ##A numpy array. The arc length of the curve at each parameter of table_t
+        self.table_s = np.concatenate(([0.0], np.add.accumulate(np.hypot(np.diff(x), np.diff(y)))))
+        Path.__init__(self, 1.0, self.table_s[-1].item())
 
     ##This method returns the derivative of the cubic bezier curve with respect to t,
     ##and evaluate it at the value t
@@ -174,19 +262,39 @@ class Curve(Path):
                 3 * self.ys[3] * t ** 2
         return (dx, dy)
 
-    ##This method returns a tuple representing the point (x, y) on the curve at the step t.
-    #Returns a tuple (x, y) representing the point
+    ##This method returns the points on the curve at all the parameters t of the bezier curve.
+    #The points are evaluated in a single call to bezier, then moved by the offset along the normal of the curve with array operations.
+    #Returns a tuple (x, y) of numpy arrays
     #@param self The object pointer
-    #@param t A Float
-    def eval(self, t):
-        p = self.c.evaluate(t)
-        x, y = p[0].item(), p[1].item()
+    #@param t A numpy array of Floats between 0 and 1
+    def eval_bezier(self, t):
+        t = np.asfortranarray(t, dtype=float)
+        p = self.c.evaluate_multi(t)
+        x, y = p[0], p[1]
         if self.offset == 0: return (x, y)
         dx, dy = self.dpdt(t)
         dir = np.arctan2(dy, dx)
-        x += self.offset * np.sin(dir)
-        y -= self.offset * np.cos(dir)
-        return (x, y)
+        return (x + self.offset * np.sin(dir), y - self.offset * np.cos(dir))
+
+    ##This method returns the points on the curve at all the arc lengths s, in one vectorized pass.
+    #Returns a tuple (x, y) of numpy arrays
+    #@param self The object pointer
+    #@param s A numpy array of Floats between 0 and the length of the curve
+    def eval_multi(self, s):
+        return self.eval_bezier(np.interp(s, self.table_s, self.table_t))
+
+    ##This method returns a tuple representing the point (x, y) on the curve at the arc length t.
+    #Returns a tuple (x, y) representing the point
+    #@param self The object pointer
+    #@param t A Float
+    def eval(self, t):
+        x, y = self.eval_multi([t])
+        return (x[0].item(), y[0].item())
+
+    ##A method to return all the points of the path as a numpy array of shape (N, 2), evaluated in one vectorized call (see Path.sample)
+    #@param self The object pointer
+    def sample(self):
+        return np.column_stack(self.eval_multi(self.steps()))
 
 ##This path is represented with a straight line.
 class Straight(Path):
@@ -213,3 +321,16 @@ class Straight(Path):
     def eval(self, t):
         return (self.x0 + t * np.cos(self.h),
                 self.y0 + t * np.sin(self.h))
+
+    ##This method returns the unit vector normal to the line, on its left, at the step t.
+    #Returns a tuple (x, y) of numpy arrays representing the vector
+    #@param self The object pointer
+    #@param t A Float or a numpy array of Floats
+    def normal(self, t):
+        t = np.asarray(t, dtype=float)
+        return (np.full(t.shape, -np.sin(self.h)), np.full(t.shape, np.cos(self.h)))
+
+    ##A method to return all the points of the path as a numpy array of shape (N, 2), evaluated in one vectorized call (see Path.sample)
+    #@param self The object pointer
+    def sample(self):
+        return np.column_stack(self.eval(self.steps()))
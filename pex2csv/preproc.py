@@ -4,7 +4,8 @@
 #Only :class:RoadProcessor should be used externally.
 
 import numpy as np
-from utils import dist
+from utils import dist, resample_line
+from staticobject import StaticObjectIndex
 
 
 ## A wrapper class for lanes that will be incrementally fed to the vector mapping module.
@@ -79,12 +80,12 @@ class StaticObjectProcessor(object):
         #
         #To take into account other Static Objects, one can add a list and implement the different create and get function
         self.TrfLight = []  
-        ##List of StaticalObject Object (defined in staticalobject.py)  
-        self.StatObjects = []
+        ##StaticObjectIndex Object (defined in staticalobject.py): the statical objects indexed by id and type
+        self.StatObjects = StaticObjectIndex()
 
     ##A method to add a statical object
     #@param self The object pointer
-    #@param statobjects A list of statical objects
+    #@param statobjects A StaticObjectIndex object (defined in staticalobject.py), the statical objects indexed by id and type
     def add_staticobject(self, statobjects):
         self.StatObjects = statobjects
 
@@ -96,12 +97,7 @@ class StaticObjectProcessor(object):
     ##A method to create a traffic light
     #@param self The object pointer
     def create_Traffic_Light(self):
-        StatObjects = self.StatObjects
-        tflLight = []
-        for id in StatObjects.keys():
-            if "Light" in id:
-                tflLight.append(StatObjects[id])
-        self.TrfLight = tflLight
+        self.TrfLight = list(self.StatObjects.get_type('TrafficLight'))
 
 
 ##Class responsible for processing the road segments for the vmap module
@@ -110,7 +106,9 @@ class RoadProcessor(object):
     ##The constructor
     #@param self The object pointer
     #@param roads A list of road objects defined in Road.py
-    def __init__(self, roads):
+    #@param lane_tolerance A Float. The largest distance in meters between a lane and the lane made of the points kept (see utils.resample_line), 0 to keep every point
+    #@param lane_spacing A Float. The largest distance in meters between two points kept on a lane. Above 1 meter, the lanes no longer follow the spacing of the vector map format
+    def __init__(self, roads, lane_tolerance=0.0, lane_spacing=1.0):
 
         # All of the following list will be filled with Lane Objects
         self.lanes = []
@@ -122,6 +120,10 @@ class RoadProcessor(object):
         # Fill up the Roads list with information from the parse module
         self.roads = roads
 
+        ##A Float. The largest distance in meters between a lane and the lane made of the points kept, 0 to keep every point
+        self.lane_tolerance = lane_tolerance
+        ##A Float. The largest distance in meters between two points kept on a lane
+        self.lane_spacing = lane_spacing
 
         # For a better understanding of the following functions/methods go to the wiki about the Vector Mapper #
 
@@ -297,6 +299,12 @@ class RoadProcessor(object):
         if(epoints):
             for point in epoints:
                 newlane.adjust_for_roundabout(point)
+        if self.lane_tolerance > 0:
+            # The turn and roundabout points were inserted above next to a lane point less than 1 meter away, so the lane is
+            # only simplified now, keeping them
+            anchors = set((x, y) for (x, y) in list(rturns or []) + list(lturns or []) + list(epoints or []))
+            fixed = [i for i, (x, y) in enumerate(newlane.lanes) if (x, y) in anchors]
+            newlane.lanes = resample_line(newlane.lanes, self.lane_tolerance, self.lane_spacing, fixed).tolist()
         self.lanes.append(newlane)
 
     ##Creates a Lane object to add to the list of center lines
@@ -0,0 +1,111 @@
+##@package record
+#This module contains the records of the roads read from the pex file by the parse module.
+#A record holds the parameters of one road, already converted from the strings of the pex file, until the Road object
+#(defined in the road file) is built from it. Records are small and picklable, so they can be stored in a cache
+#or sent to the processes building the roads.
+
+from road import *
+
+##The base class of the records. Each subclass gives the class of the road it builds and, in its slots, the names of the
+#parameters of the constructor of that class, in the same order.
+class RoadRecord:
+    __slots__ = ()
+    ##The Road class built from the record
+    road_class = None
+
+    ##The constructor
+    #@param self The object pointer
+    #@param parameters The parameters of the constructor of the road, the first one being the id of the road
+    def __init__(self, *parameters):
+        if len(parameters) != len(self.__slots__):
+            raise TypeError(type(self).__name__ + " takes " + str(len(self.__slots__)) + " parameters (" + str(len(parameters)) + " given)")
+        for name, value in zip(self.__slots__, parameters):
+            setattr(self, name, value)
+
+    ##This method returns the parameters of the constructor of the road, in order
+    #@param self The object pointer
+    def parameters(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    ##This method builds the Road object described by the record
+    #@param self The object pointer
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def build(self, lazy=False):
+        return self.road_class(*self.parameters(), lazy=lazy)
+
+    ##This method returns the parameters of the record, so that records can be pickled
+    #@param self The object pointer
+    def __getstate__(self):
+        return self.parameters()
+
+    ##This method sets the parameters of an unpickled record
+    #@param self The object pointer
+    #@param state The tuple of parameters returned by __getstate__
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    ##This method returns a short description of the record
+    #@param self The object pointer
+    def __repr__(self):
+        return type(self).__name__ + "(" + repr(self.id) + ")"
+
+##The record of a BendRoad
+class BendRecord(RoadRecord):
+    __slots__ = ('id', 'x0', 'y0', 'h', 'rh', 'clr', 'lw', 'nbr_of_lanes', 'lanes_going_OUT', 'SpeedL', 'RefS', 'Stl', 'cw')
+    road_class = BendRoad
+
+##The record of a ClothoidRoads
+class ClothoidRecord(RoadRecord):
+    __slots__ = ('id', 'x0', 'y0', 'h', 'C2', 'Lstart', 'Lend', 'flipped', 'lw', 'nbr_of_lanes', 'lanes_in_x_dir', 'Tabpointcon', 'SpeedL', 'RefS', 'cw', 'Stl')
+    road_class = ClothoidRoads
+
+##The record of a CurvedRoad
+class CurvedRecord(RoadRecord):
+    __slots__ = ('id', 'x0', 'y0', 'h', 'rh', 'cp1', 'cp2', 'dx', 'dy', 'lw', 'nbr_of_lanes', 'lanes_going_OUT', 'SpeedL', 'RefS', 'Stl', 'cw')
+    road_class = CurvedRoad
+
+##The record of a RoundaboutRoad
+class RoundaboutRecord(RoadRecord):
+    __slots__ = ('id', 'origin_x0', 'origin_y0', 'radius', 'lane_width', 'heading_of_crosssection', 'filletradius_of_crosssection',
+                 'number_of_lanes_of_crossection', 'number_of_lanes_in_xdirection_in_crosssection', 'number_of_lanes', 'SpeedL', 'RefS',
+                 'mid_crosssection_points', 'road_end_marker_in_crosssection', 'cross_walk')
+    road_class = RoundaboutRoad
+
+##The record of a StraightRoad
+class StraightRecord(RoadRecord):
+    __slots__ = ('id', 'x0', 'y0', 'h', 'l', 'lw', 'nbr_of_lanes', 'lanes_going_OUT', 'SpeedL', 'RefS', 'Stl', 'cw')
+    road_class = StraightRoad
+
+##The record of a Crosswalkr
+class CrosswalkRecord(RoadRecord):
+    __slots__ = ('id', 'x0', 'y0', 'h', 'l', 'lw', 'nbr_of_lanes', 'lanes_going_OUT', 'SpeedL', 'RefS', 'cw')
+    road_class = Crosswalkr
+
+##The record of an AdapterRoad
+class AdapterRecord(RoadRecord):
+    __slots__ = ('id', 'x0', 'y0', 'h', 'l', 'lw', 'nbr_of_lanes_start', 'nbr_of_lanes_end', 'lanes_in_x_dir_start', 'lanes_in_x_dir_end',
+                 'SpeedL', 'RefS', 'Stl', 'cw', 'lane_offset')
+    road_class = AdapterRoad
+
+##The record of an EntryRoad
+class EntryRecord(RoadRecord):
+    __slots__ = ('id', 'x0', 'y0', 'h', 'l', 'lw', 'nbr_of_lanes', 'lanes_going_OUT', 'entry_road_angle', 'apron_length', 'side_road_length',
+                 'SpeedL', 'RefS', 'Stl', 'cw')
+    road_class = EntryRoad
+
+##The record of an ExitRoad
+class ExitRecord(RoadRecord):
+    __slots__ = ('id', 'x0', 'y0', 'h', 'l', 'lw', 'nbr_of_lanes', 'lanes_going_OUT', 'exit_road_angle', 'apron_length', 'side_road_length',
+                 'SpeedL', 'RefS', 'Stl', 'cw')
+    road_class = ExitRoad
+
+##The record of an XCrossRoad
+class XCrossRecord(RoadRecord):
+    __slots__ = ('id', 'x0', 'y0', 'h', 'lw', 'cs_h', 'cs_len_till_stop', 'cs_nbr_of_lanes', 'cs_lanes_going_OUT', 'cs_l', 'SpeedL', 'RefS', 'Stl', 'cw')
+    road_class = XCrossRoad
+
+##The record of a YCrossRoad
+class YCrossRecord(RoadRecord):
+    __slots__ = ('id', 'x0', 'y0', 'h', 'lw', 'cs_h', 'cs_len_till_stop', 'cs_nbr_of_lanes', 'cs_lanes_going_OUT', 'cs_l', 'SpeedL', 'RefS', 'Stl', 'cw')
+    road_class = YCrossRoad
@@ -12,12 +12,18 @@ from utils import *
 #Every road has certain things in common such as a center, edges, lanes and SpeedLimit/RefSpeed.
 class Road:
 
+    ##The names of the attributes computed by the build_geometry method of the road
+    geometry_attributes = ('c', 'e1', 'e2', 'l')
+
     ##The constructor
     #@param self The object pointer
     #@param id A string. The road type id.
-    def __init__(self, id):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see defer_geometry)
+    def __init__(self, id, lazy=False):
         ##A string. Represent the ID of the road (Bendroad, StraightRoad...).The exact ID can be found in the pex file.
         self.id = id
+        ##A boolean. True if the geometry of the road is only computed when it is first used
+        self.lazy = lazy
         ##A list of points (x, y) defining the center of the road
         self.c = []
         ##A list of points (x, y) defining one edge of the road
@@ -41,6 +47,61 @@ class Road:
         ##A list of Float defining the speed profile (Speed Limit per RoadType)
         self.SpeedProfil = self.SpeedProfil = [70,40,70,70,20,90,20,70,70,50]
 
+    ##This method computes the geometry of the road (its lanes, center and edges) by calling build_geometry with the given parameters.
+    #In lazy mode, the call is delayed until one of the geometry attributes is used for the first time, so the roads can be
+    #created quickly when only their parameters (id, speeds, stoplines...) are needed.
+    #@param self The object pointer
+    #@param args The parameters of the build_geometry method of the road
+    def defer_geometry(self, *args):
+        if not self.lazy:
+            self.build_geometry(*args)
+            return
+        for name in self.geometry_attributes:
+            del self.__dict__[name]
+        ##The parameters of build_geometry, kept until the geometry is computed
+        self.pending_geometry = args
+
+    ##This method is only called when an attribute is not found. If the geometry of the road was delayed, it is computed
+    #and the attribute is looked for again.
+    #@param self The object pointer
+    #@param name A string. The name of the attribute
+    def __getattr__(self, name):
+        pending = self.__dict__.get('pending_geometry')
+        if pending is None or name.startswith('__'):
+            raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+        del self.pending_geometry
+        for attribute in self.geometry_attributes:
+            setattr(self, attribute, [])
+        self.build_geometry(*pending)
+        return getattr(self, name)
+
+    ##This method returns the lane turning from the end of a lane going in a crossroad to the start of a lane going out of it.
+    #The turn is a bezier curve going from the last point of lane_in to the first point of lane_out, with the intersection of the two
+    #lanes as control point. If the intersection is less than 0.5 meter away from a point of lane_in (or lane_out), the curve starts
+    #at the point before it (respectively ends at the point after it), so that the curve is smoother. The points are found with
+    #array operations on the whole lanes. The points of the curve that are the same once rounded to 0.1 mm are only kept once.
+    #Returns a numpy array of shape (N, 2)
+    #@param self The object pointer
+    #@param lane_in A numpy array of shape (N, 2). The lane going in the crossroad
+    #@param lane_out A numpy array of shape (M, 2). The lane going out of the crossroad
+    #@param scan_end An integer. Only the points of lane_in before this index are compared to the intersection
+    def connect_lanes(self, lane_in, lane_out, scan_end):
+        (x3, y3) = Intersection_Lines(lane_in, lane_out)
+
+        (x1, y1) = lane_in[len(lane_in) - 1]
+        close = np.flatnonzero(np.sqrt((lane_in[1:scan_end, 0] - x3)**2 + (lane_in[1:scan_end, 1] - y3)**2) < 0.5)
+        if len(close) > 0:
+            (x1, y1) = lane_in[close[-1]] # the point before the last close point, as lane_in[1:] is shifted by one
+
+        (x2, y2) = lane_out[0]
+        close = np.flatnonzero(np.sqrt((lane_out[:, 0] - x3)**2 + (lane_out[:, 1] - y3)**2) < 0.5)
+        if len(close) > 0:
+            (x2, y2) = lane_out[close[0] + 1]
+
+        points = Curve([x1, x3, x3, x2], [y1, y3, y3, y2], 0).sample()
+        rounded = np.round(points, 4)
+        return points[np.concatenate(([True], (rounded[1:] != rounded[:-1]).any(axis=1)))]
+
     ##This method returns the starting coordinates of the road's center path. 
     #Some road segments might not have a starting point, for example the roundabout road. Those segments will have to override this function accordingly.
     #
@@ -55,6 +116,14 @@ class Road:
     def getend(self):
         return self.c[0].getend()
 
+    ##This method adds lanes to the road. The first lanes drive backwards, so they are reversed, which does not copy their points.
+    #@param self The object pointer
+    #@param lanes A list of numpy arrays of shape (N, 2), or an array of lanes returned by Path.sample_lanes
+    #@param backwards An integer. The number of lanes driving backwards
+    def add_lanes(self, lanes, backwards):
+        for i, lane in enumerate(lanes):
+            self.l.append(lane[::-1] if i < backwards else lane)
+
 ##This a representation of the bend road in Prescan.
 class BendRoad(Road):
 
@@ -73,11 +142,12 @@ class BendRoad(Road):
     #@param RefS A float. The reference speed
     #@param Stl List of lists contening relevant points (3 points per list) describing a stopline
     #@param cw List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk
-    def __init__(self, id, x0, y0, h, rh, clr, lw, nbr_of_lanes, lanes_going_OUT, SpeedL, RefS, Stl, cw):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, h, rh, clr, lw, nbr_of_lanes, lanes_going_OUT, SpeedL, RefS, Stl, cw, lazy=False):
 
         # General Initialization
 
-        Road.__init__(self, id)     #Gave the Id linked to BendRoad
+        Road.__init__(self, id, lazy)     #Gave the Id linked to BendRoad
         ##A float. The speed limit
         self.SpeedLimit = SpeedL    #Set the different speeds
         ##A float. The reference speed
@@ -89,7 +159,11 @@ class BendRoad(Road):
         ##A Float. Represent the speed that the road has per default (defined by the speedprofil in the Road Class)
         self.DefinedSpeed = self.SpeedProfil[1]
 
+        self.defer_geometry(x0, y0, h, rh, clr, lw, nbr_of_lanes, lanes_going_OUT)
 
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, h, rh, clr, lw, nbr_of_lanes, lanes_going_OUT):
         # Lanes, Center and Edges of the Road
 
         self.c.append(Bend( x0, y0, h, rh, clr))
@@ -102,21 +176,9 @@ class BendRoad(Road):
                         y0 - lw * (nbr_of_lanes/2) * np.sin(h + np.pi / 2),
                         h, rh, clr + np.sign(rh) * lw * (nbr_of_lanes -lanes_going_OUT)))
 
-        lwi = (nbr_of_lanes - 1) * lw                                         #This work. To better understand how, i recommand doing this code by hand in a simple case
-        for _ in range(nbr_of_lanes):
-            self.l.append(Bend( x0 + lwi * np.cos(h + np.pi / 2) / 2,
-                                y0 + lwi * np.sin(h + np.pi / 2) / 2,
-                               h, rh, clr - np.sign(rh) * lwi / 2))
-            lwi -= 2 * lw
-
-        #This changes the direction of the lanes that drive backwards
-        if nbr_of_lanes-lanes_going_OUT>0:
-            for i in range(nbr_of_lanes-lanes_going_OUT):
-                l=[]
-                for (x, y) in self.l[i]:
-                    l.append([x, y])
-                l = l[::-1]
-                self.l[i] = l
+        # All the lanes are sampled at once along the center, from the leftmost one, and the lanes driving backwards are reversed
+        offsets = (nbr_of_lanes - 1) * lw / 2 - lw * np.arange(nbr_of_lanes)
+        self.add_lanes(self.c[0].sample_lanes(offsets), nbr_of_lanes - lanes_going_OUT)
 
 ##This is a representation of Spiral roads (Clothoïd) in Prescan. An Euler Spiral is used to represent it
 class ClothoidRoads (Road):
@@ -141,11 +203,12 @@ class ClothoidRoads (Road):
     #@param cw list of lists with relevant points (3 points per lists) describing a crosswalk. Base component is a Float.
     #@param Stl List of lists contening relevant points (3 points per list) describing a stopline. Base component is a Float.
 
-    def __init__(self, id, x0, y0, h, C2, Lstart, Lend, flipped, lw, nbr_of_lanes, lanes_in_x_dir, Tabpointcon, SpeedL, RefS, cw, Stl):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, h, C2, Lstart, Lend, flipped, lw, nbr_of_lanes, lanes_in_x_dir, Tabpointcon, SpeedL, RefS, cw, Stl, lazy=False):
 
         # General Initialization
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The reference speed
@@ -157,32 +220,21 @@ class ClothoidRoads (Road):
         ##A Float. Represent the speed that the road has per default (defined by the speedprofil in the Road Class)
         self.DefinedSpeed = self.SpeedProfil[2]
 
+        self.defer_geometry(x0, y0, h, C2, Lstart, Lend, flipped, lw, nbr_of_lanes, lanes_in_x_dir, Tabpointcon)
 
-        # we calculate clothoid roads with an integration, so, step by step, the error increases and the last point
-        # of the clothoid is one of two meter away of where it shoul be. In order to correct it, we calculate 2
-        # spirals : one starting from (x0,y0) going in the x direction, and one starting from the end of the road
-        # (xend2, yend2) and going in the reverse x direction. Then we obtain the good spiral by making the average
-        # spiral of the 2 spirals calculated. The average is weigh by the curvilinear abscissa of the point we calculate.
-        # (xend, yend) is the (x0,y0) of the road attached to the end of the spiral road
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, h, C2, Lstart, Lend, flipped, lw, nbr_of_lanes, lanes_in_x_dir, Tabpointcon):
+        # The center of the road is computed exactly with the Fresnel integrals (see Clothoid). If the spiral road is flipped,
+        # the center is the axial symmetric of the spiral. symmetry axis : line with heading = h and going through (x0,y0)
         diff = nbr_of_lanes/2
-        center1 = Clothoid(x0, y0, h, C2, 1.0, Lstart, Lend)
-        cent1 = []
-        for (x,y) in center1 :
-            cent1.append([x,y])
-            xend, yend = x,y
-
-        if flipped == True : # if the spiral road is flipped, (xend,yend) is the axial symmetric of (xend,yend) calculated.  symmetry axis : line with heading = h and going through (x0,y0)
-            a1 = np.tan(h)
-            b1 = y0 - a1*x0
-            a2 = np.tan(h+np.pi/2)
-            b2 = cent1[len(cent1)-1][1] - a2*cent1[len(cent1)-1][0]
-            xi = (b2-b1)/(a1-a2)
-            yi = a1*xi + b1
-            cent1[len(cent1)-1][0] = 2*xi - cent1[len(cent1)-1][0]
-            cent1[len(cent1)-1][1] = 2*yi - cent1[len(cent1)-1][1]
-
-
-        xend, yend = cent1[len(cent1)-1][0], cent1[len(cent1)-1][1]
+        cent = Clothoid(x0, y0, h, C2, 1.0, Lstart, Lend).sample()
+        if flipped == True :
+            reflection = np.array([[np.cos(2*h), np.sin(2*h)], [np.sin(2*h), -np.cos(2*h)]])
+            cent = (cent - cent[0]) @ reflection + cent[0]
+
+        # (xend2, yend2) is the (x0,y0) of the road attached to the end of the spiral road
+        xend, yend = cent[len(cent)-1][0], cent[len(cent)-1][1]
         xend2, yend2 = xend + 1000, yend - 1000
         for k in range (len(Tabpointcon)): # here we find (xend2, yend2)
             if Tabpointcon[k] != []:
@@ -192,85 +244,22 @@ class ClothoidRoads (Road):
         if dist((xend2,yend2),(xend,yend))>5 : # if the end of the spiral road is not connected to the start of an other road
             print ("The rules of the wiki aren't followed : you should connect the end of a spiral road to the start of an other road (except crossroads/roundabouts)")
 
-        center2 =  Clothoid(xend2, yend2, h, C2, -1.0, Lend, Lstart) # spiral driving backwards
-        cent2 = []
-        for (x,y) in center2 :
-            cent2.append([x,y])
-
-        if flipped == True : # reverses the spiral (cf line 215)
-            c =[cent1,cent2]
-            a1 = np.tan(h)
-            a2 = np.tan(h+np.pi/2)
-            for elem in c :
-                b1 = elem[0][1] - a1*elem[0][0]
-                for k in range (len(elem)):
-                    b2 = elem[k][1] - a2*elem[k][0]
-                    xi = (b2-b1)/(a1-a2)
-                    yi = a1*xi + b1
-                    elem[k][0] = 2*xi - elem[k][0]
-                    elem[k][1] = 2*yi - elem[k][1]
-
-        cent = []
-        nbr = min(len(cent1),len(cent2))
-        for k in range(nbr): # average of the two spirals
-            x1, y1 = cent1[k]
-            x2, y2 = cent2[nbr-1-k]
-            x = (x1*(nbr-k-1) + x2*k)/(nbr-1)
-            y = (y1*(nbr-k-1) + y2*k)/(nbr-1)
-            cent.append([x,y])
-
         if (h>np.pi/2) and (h<3*np.pi/2) :
-            cent.reverse()
-
-
-        for i in range (nbr_of_lanes): # now we add the lanes
-            lane = []
-            count = 0
-            angle = h
-            for (x,y) in cent :
-                if count>0:
-                    pt0 = (cent[count-1])
-                    pt1 = (cent[count])
-
-                else :
-                    pt0 = cent[0]
-                    pt1 = cent[1]
-                H = dist(pt0,pt1)
-                A = abs(pt0[0]-pt1[0])
-                if H != 0:
-                    angle = np.arccos( A / H )
-                    if pt0[0]< pt1[0]:
-                        if pt1[1]< pt0[1]:
-                            angle = -angle
-                        x1 = x - lw*(i+0.5-diff)*np.sin(angle)
-                        y1 = y + lw*(i+0.5-diff)*np.cos(angle)
-
-                    else:
-                        if pt1[1]> pt0[1]:
-                            angle = -angle
-                        x1 = x + lw*(i+0.5-diff)*np.sin(angle)
-                        y1 = y - lw*(i+0.5-diff)*np.cos(angle)
-                    lane.append([x1,y1])
-                count += 1
-            self.l.append(lane)
-
-
-
-
-        if nbr_of_lanes-lanes_in_x_dir>0: # reverse the lanes driving backwards
-            for j in range(nbr_of_lanes-lanes_in_x_dir):
-                lane=[]
-                for (x, y) in self.l[j+lanes_in_x_dir]:
-                    lane.append([x, y])
-                lane = lane[::-1]
-                self.l[j+lanes_in_x_dir] = lane
-
-
-
-
+            cent = cent[::-1]
 
 
+        # now we add the lanes. The heading at each point of the center is the heading of the segment ending at it (of the first
+        # segment for the first point), and the lanes are moved from the center along the normals. Repeated points are skipped.
+        delta = np.diff(cent, axis=0)
+        delta = np.concatenate((delta[:1], delta))
+        heading = np.arctan2(delta[:, 1], delta[:, 0])
+        normals = np.column_stack((-np.sin(heading), np.cos(heading)))
+        distinct = np.hypot(delta[:, 0], delta[:, 1]) != 0
+        offsets = lw * (np.arange(nbr_of_lanes) + 0.5 - diff)
+        lanes = cent[distinct] + offsets[:, None, None] * normals[distinct]
 
+        for i in range(nbr_of_lanes): # the last lanes drive backwards, so they are reversed
+            self.l.append(lanes[i][::-1] if i >= lanes_in_x_dir else lanes[i])
 
 ##This a representation of the curved road in Prescan. A bezier curve is used to represent it.
 class CurvedRoad(Road):
@@ -295,11 +284,12 @@ class CurvedRoad(Road):
     #@param cw List of lists with relevant points (3 points per lists) describing a crosswalk. Base component is a Float.
     #@param Stl List of lists contening relevant points (3 points per list) describing a stopline. Base component is a Float.
 
-    def __init__(self, id, x0, y0, h, rh, cp1, cp2, dx, dy, lw, nbr_of_lanes, lanes_going_OUT, SpeedL, RefS, Stl, cw): #Same as BendRoad
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, h, rh, cp1, cp2, dx, dy, lw, nbr_of_lanes, lanes_going_OUT, SpeedL, RefS, Stl, cw, lazy=False): #Same as BendRoad
 
         # General Initialization
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The speed of reference
@@ -311,6 +301,11 @@ class CurvedRoad(Road):
         ##A Float. Represent the speed that the road has per default (defined by the speedprofile in the Road Class)
         self.DefinedSpeed = self.SpeedProfil[2]
 
+        self.defer_geometry(x0, y0, h, rh, cp1, cp2, dx, dy, lw, nbr_of_lanes, lanes_going_OUT)
+
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, h, rh, cp1, cp2, dx, dy, lw, nbr_of_lanes, lanes_going_OUT):
         # Creation of the points needed for the Bezier Curve
 
         x_ = dx * np.cos(h) - dy * np.sin(h)
@@ -340,17 +335,16 @@ class CurvedRoad(Road):
         #This changes the direction of the lanes that drive backwards
         if nbr_of_lanes-lanes_going_OUT>0:
             for i in range(nbr_of_lanes-lanes_going_OUT):
-                l=[]
-                for (x, y) in self.l[i]:
-                    l.append([x, y])
-                l = l[::-1]
-                self.l[i] = l
+                self.l[i] = self.l[i].sample()[::-1]
 
 
 
 ##This a representation of the roundabout. Each roundabout contains road cross sections that represent the exits and entries to the segment.
 class RoundaboutRoad(Road):
      
+    ##The names of the attributes computed by the build_geometry method, the stoplines are found from the lanes of the roundabout
+    geometry_attributes = ('c', 'e1', 'e2', 'l', 'stopline')
+
     ##The constructor
     #@param self the object pointer
     #@param id A string. Unique id
@@ -368,14 +362,15 @@ class RoundaboutRoad(Road):
     #@param mid_crosssection_points A list of the connecting points between roads.
     #@param road_end_marker_in_crosssection A string. A string which shows whether stoplines are included or not
     #@param cross_walk List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base component is a Float.
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
     
-    def __init__(self, id, origin_x0, origin_y0, radius, lane_width, heading_of_crosssection, filletradius_of_crosssection, number_of_lanes_of_crossection, number_of_lanes_in_xdirection_in_crosssection, number_of_lanes, SpeedL, RefS, mid_crosssection_points,road_end_marker_in_crosssection, cross_walk):
+    def __init__(self, id, origin_x0, origin_y0, radius, lane_width, heading_of_crosssection, filletradius_of_crosssection, number_of_lanes_of_crossection, number_of_lanes_in_xdirection_in_crosssection, number_of_lanes, SpeedL, RefS, mid_crosssection_points,road_end_marker_in_crosssection, cross_walk, lazy=False):
 
 
 
         # General Initialization
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The speed of reference
@@ -387,20 +382,25 @@ class RoundaboutRoad(Road):
         self.DefinedSpeed = self.SpeedProfil[3]
         ##List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base component is a Float.
         self.crosswalk = cross_walk
-        
+
+        self.defer_geometry(origin_x0, origin_y0, radius, lane_width, heading_of_crosssection, filletradius_of_crosssection, number_of_lanes_of_crossection, number_of_lanes_in_xdirection_in_crosssection, number_of_lanes, mid_crosssection_points, road_end_marker_in_crosssection)
+
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, origin_x0, origin_y0, radius, lane_width, heading_of_crosssection, filletradius_of_crosssection, number_of_lanes_of_crossection, number_of_lanes_in_xdirection_in_crosssection, number_of_lanes, mid_crosssection_points, road_end_marker_in_crosssection):
         # Creating the lanes of roundabout using circles defining the lanes.
         # For the first lane, we take radius as the same radius of roundabout and calculate the lane points
+        # Each circle is sampled once, and its points are both the lane and the points used to attach the entry and exit lanes.
         radius_of_circles_defining_roundabout = radius
+        rings = []
         for lane_index in range(number_of_lanes):
             # From path.py we find the geometry related to bend road which defines the roundabout
             lane_geometry =Bend(origin_x0, origin_y0 - (radius_of_circles_defining_roundabout - lane_width/2), 0, 2 * np.pi, radius_of_circles_defining_roundabout - lane_width/2)
+            rings.append(lane_geometry)
             # For the second lane we take the radius subtracting the lane width,and calculate the lane points
             radius_of_circles_defining_roundabout = (radius_of_circles_defining_roundabout - lane_width)
-            #Next we append the lane points to the current lane.
-            points_of_the_current_lane = []
-            for (x,y) in lane_geometry:
-                points_of_the_current_lane.append([x, y])
-            self.l.append(points_of_the_current_lane)
+            #Next we append the lane points to the lanes.
+            self.l.append(lane_geometry.sample())
 
         # A Roundabout road has four crosssections,for each cross section,there is an entry and exit lane.
         # To create each of these lanes, we use these parameters defined below.
@@ -442,15 +442,8 @@ class RoundaboutRoad(Road):
                 (x_position_of_intersection,y_position_of_intersection) = Intersection_Circle(circle_entry_lane,main_circle)[1]
 
                 #Next we find  the  point on the main circle which is closest to the point of intersection.
-                #To find that we keep on calculating the distance between  two points,and take the point which returns the minimum distance value,as the closest.
-                # Initially we set the  distance between first point of the lane point as the minimum distance and calculate the distance of that point to the point of intersection.
-                minimum_distance = dist(self.l[0][0],(x_position_of_intersection,y_position_of_intersection))
-                index_value_of_closest_point = 0
-                for n in range(len(self.l[0])):
-                    # Calculating the distance using dist function and comparing it with the initial value
-                    if dist(self.l[0][n],(x_position_of_intersection,y_position_of_intersection)) < minimum_distance:
-                        minimum_distance = dist(self.l[0][n],(x_position_of_intersection,y_position_of_intersection))
-                        index_value_of_closest_point = n
+                #The main circle is sampled at known angles, so the closest point is found from the angle of the point of intersection.
+                index_value_of_closest_point = rings[0].closest_index((x_position_of_intersection,y_position_of_intersection), self.l[0])
 
                 #Next we define the three points for forming the curve road, which defines the entry lane
 
@@ -464,7 +457,7 @@ class RoundaboutRoad(Road):
                 # From path.py, we find out the lane geometry related to curved road and append the points to the lane,which ultimately forms the entry lane.
                 lane_geometry = Curve(x_position_for_defining_curve, y_position_for_defining_curve, 0)
                 points_of_the_current_lane = []
-                for (x,y) in lane_geometry:
+                for (x,y) in lane_geometry.sample():
                     points_of_the_current_lane.append([x, y])
                 counter +=1
                 self.l.append(points_of_the_current_lane)
@@ -484,13 +477,7 @@ class RoundaboutRoad(Road):
 
                 (x_position_of_intersection,y_position_of_intersection) = Intersection_Circle(circle_exit_lane,main_circle)[0]
 
-                minimum_distance= dist(self.l[0][0],(x_position_of_intersection,y_position_of_intersection))
-                index_value_of_closest_point = 0
-                for n in range(len(self.l[0])):
-
-                    if dist(self.l[0][n],(x_position_of_intersection,y_position_of_intersection)) < minimum_distance:
-                        minimum_distance = dist(self.l[0][n],(x_position_of_intersection,y_position_of_intersection))
-                        index_value_of_closest_point = n
+                index_value_of_closest_point = rings[0].closest_index((x_position_of_intersection,y_position_of_intersection), self.l[0])
 
 
                 (x_position_of_firstpoint, y_position_of_firstpoint) = self.l[0][index_value_of_closest_point-5]
@@ -501,7 +488,7 @@ class RoundaboutRoad(Road):
                 y_position_for_defining_curve = [y_position_of_firstpoint, y_position_of_secondpoint, y_position_of_thirdpoint, y_position_of_lane_startingpoint]
                 lane_geometry = Curve(x_position_for_defining_curve, y_position_for_defining_curve, 0)
                 points_of_the_current_lane = []
-                for (x,y) in lane_geometry:
+                for (x,y) in lane_geometry.sample():
                     points_of_the_current_lane.append([x, y])
                 self.l.append(points_of_the_current_lane)
                 counter +=1
@@ -510,17 +497,11 @@ class RoundaboutRoad(Road):
         #To find the three points used for calculating the stop line,we use the same math as we used for calculating the entry and exit lane
         #Except that we use the radius as radius of the roundabout and not substracting it from the lane width
 
-        # First we need to find out points for an alternate lane ,with radius of the circles defining roundbout
+        # First we need to find out points for an alternate lane ,with the radius of the roundabout. Only this outer circle is used
+        # by the stoplines, so it is sampled once for all the cross sections.
 
-        alternate_lane = []
-        radius_for_alternate_lane = radius
-        for lane_index in range(number_of_lanes):
-            alternate_lane_geometry =Bend(origin_x0, origin_y0 - (radius_for_alternate_lane), 0, 2 * np.pi, radius_for_alternate_lane)
-            radius_for_alternate_lane = (radius_for_alternate_lane - lane_width)
-            current_alternate_lane = []
-            for (x,y) in alternate_lane_geometry:
-                current_alternate_lane.append([x, y])
-                alternate_lane.append(current_alternate_lane)
+        alternate_ring = Bend(origin_x0, origin_y0 - radius, 0, 2 * np.pi, radius)
+        alternate_lane = alternate_ring.sample()
         for crosssection_index in range(4):
 
             road_end_marker = road_end_marker_in_crosssection[crosssection_index]
@@ -546,18 +527,13 @@ class RoundaboutRoad(Road):
                         
                     (x_position_of_intersection,y_position_of_intersection) = Intersection_Circle(circle_entry_lane,main_circle)[1]
 
-                    minimum_distance = dist(alternate_lane[0][0],(x_position_of_intersection,y_position_of_intersection))
-                    index_value_of_closest_point = 0
-                    for n in range(len(alternate_lane[0])):
-                        if dist(alternate_lane[0][n],(x_position_of_intersection,y_position_of_intersection)) < minimum_distance:
-                            minimum_distance = dist(alternate_lane[0][n],(x_position_of_intersection,y_position_of_intersection))
-                            index_value_of_closest_point = n
+                    index_value_of_closest_point = alternate_ring.closest_index((x_position_of_intersection,y_position_of_intersection), alternate_lane)
 
                     #Here we find out the three points defining the stopline
 
-                    (x_positon_first_point_of_stopline, y_position_first_point_of_stopline) = alternate_lane[0][index_value_of_closest_point+3]
+                    (x_positon_first_point_of_stopline, y_position_first_point_of_stopline) = alternate_lane[index_value_of_closest_point+3]
                     
-                    (x_position_second_point_of_stopline, y_position_second_point_of_stopline) = alternate_lane[0][index_value_of_closest_point]
+                    (x_position_second_point_of_stopline, y_position_second_point_of_stopline) = alternate_lane[index_value_of_closest_point]
                        
                     (x_position_third_point_of_stopline,y_position_third_point_of_stopline)= (((x_positon_first_point_of_stopline+x_position_second_point_of_stopline)/2),((y_position_first_point_of_stopline+y_position_second_point_of_stopline)/2))
                     
@@ -581,11 +557,12 @@ class ExitLane(Road):
     #@param SpeedL A float. The speed limit
     #@param RefS A float. The reference speed
     #@param cw List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base components are floats.
-    def __init__(self, id, x0, y0, r, lw, ch, nbr_of_lanes, SpeedL, RefS, cw):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, r, lw, ch, nbr_of_lanes, SpeedL, RefS, cw, lazy=False):
 
         # General Init
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The reference speed
@@ -606,6 +583,11 @@ class ExitLane(Road):
         ##List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base components are floats.
         self.crosswalk = cw
 
+        self.defer_geometry(x0, y0, r, lw, ch)
+
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, r, lw, ch):
         # Get exit lanes
 
         # For edges
@@ -688,11 +670,12 @@ class StraightRoad(Road):
     #@param RefS A float. The reference speed
     #@param Stl List of lists contening relevant points (3 points per list) describing a stopline. Base components are floats.
     #@param cw List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base components are floats.
-    def __init__(self, id, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, SpeedL, RefS, Stl, cw):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, SpeedL, RefS, Stl, cw, lazy=False):
 
         # General Init
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The reference speed
@@ -704,6 +687,11 @@ class StraightRoad(Road):
         ##A float. Represents the speed that the road has per default (defined by the speedprofile in the Road Class)
         self.DefinedSpeed = self.SpeedProfil[0]
 
+        self.defer_geometry(x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT)
+
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT):
         # Edges, Center Line and Lanes
 
         self.c.append(Straight( x0, y0, h, l))
@@ -714,21 +702,9 @@ class StraightRoad(Road):
         self.e2.append(Straight( x0 + (nbr_of_lanes/2)*lw * np.cos(h + np.pi / 2),
                                 y0 + lw * (nbr_of_lanes/2) * np.sin(h + np.pi / 2), h, l))
 
-        lwi = (nbr_of_lanes -1) * lw/2
-        for _ in range(nbr_of_lanes):
-            self.l.append(Straight( x0 + lwi * np.cos(h + np.pi / 2),
-                                    y0 + lwi * np.sin(h + np.pi / 2),
-                                    h, l))
-            lwi -= lw
-
-        #This changes the direction of the lanes that drive backwards
-        if nbr_of_lanes-lanes_going_OUT>0:
-            for i in range(nbr_of_lanes-lanes_going_OUT):
-                l=[]
-                for (x, y) in self.l[i]:
-                    l.append([x, y])
-                l = l[::-1]
-                self.l[i] = l
+        # All the lanes are sampled at once along the center, from the leftmost one, and the lanes driving backwards are reversed
+        offsets = (nbr_of_lanes - 1) * lw / 2 - lw * np.arange(nbr_of_lanes)
+        self.add_lanes(self.c[0].sample_lanes(offsets), nbr_of_lanes - lanes_going_OUT)
 
 ##This a representation of a crosswalk road in Prescan.
 class Crosswalkr(Road):
@@ -747,11 +723,12 @@ class Crosswalkr(Road):
     #@param RefS A float. The reference speed
     #@param Stl List of lists contening relevant points (3 points per list) describing a stopline
     #@param cw List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base componemts are floats.
-    def __init__(self, id, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, SpeedL, RefS, cw):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, SpeedL, RefS, cw, lazy=False):
 
         # General Init
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The reference speed
@@ -761,6 +738,11 @@ class Crosswalkr(Road):
         ##A float. Represents the speed that the road has per default (defined by the speedprofile in the Road Class)
         self.DefinedSpeed = self.SpeedProfil[0]
 
+        self.defer_geometry(x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT)
+
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT):
         # Edges, Center Line and Lanes
 
         self.c.append(Straight( x0, y0, h, l))
@@ -781,11 +763,7 @@ class Crosswalkr(Road):
         #This changes the direction of the lanes that drive backwards
         if nbr_of_lanes-lanes_going_OUT>0:
             for i in range(nbr_of_lanes-lanes_going_OUT):
-                l=[]
-                for (x, y) in self.l[i]:
-                    l.append([x, y])
-                l = l[::-1]
-                self.l[i] = l
+                self.l[i] = self.l[i].sample()[::-1]
 
 ##This a representation of an adapter road in Prescan.
 class AdapterRoad(Road):
@@ -807,11 +785,12 @@ class AdapterRoad(Road):
     #@param Stl List of lists contening relevant points (3 points per list) describing a stopline
     #@param cw List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base components are floats.
     #@param lane_offset An integer. Represents the lane offset of the adapter (>0 if we remove lanes, <0 if we add lanes)
-    def __init__(self, id, x0, y0, h, l, lw, nbr_of_lanes_start, nbr_of_lanes_end, lanes_in_x_dir_start, lanes_in_x_dir_end, SpeedL, RefS, Stl, cw, lane_offset):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, h, l, lw, nbr_of_lanes_start, nbr_of_lanes_end, lanes_in_x_dir_start, lanes_in_x_dir_end, SpeedL, RefS, Stl, cw, lane_offset, lazy=False):
 
         # General Init
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The reference speed
@@ -823,6 +802,11 @@ class AdapterRoad(Road):
         ##A float. Represents the speed that the road has by default (defined by the speedprofile in the Road Class)
         self.DefinedSpeed = self.SpeedProfil[5]
 
+        self.defer_geometry(x0, y0, h, l, lw, nbr_of_lanes_start, nbr_of_lanes_end, lanes_in_x_dir_start, lanes_in_x_dir_end, lane_offset)
+
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, h, l, lw, nbr_of_lanes_start, nbr_of_lanes_end, lanes_in_x_dir_start, lanes_in_x_dir_end, lane_offset):
         # Edges, Center Line and Lanes
 
         self.c.append(Straight( x0, y0, h, l))
@@ -858,21 +842,10 @@ class AdapterRoad(Road):
                                     y0 + (l/2)*np.sin(h) - lw*(offset_center-lo_left)*np.cos(h), h, l/2))
 
 
-            lanes_before=[]
-            lanes_after=[]
-            counter_s = nbr_of_lanes_start -1
-
-            # here we create the lanes juste before the change
+            # here we create the lanes juste before the change, all at once from the leftmost one
 
-            while counter_s > -1 :
-                lane = Straight( x0 + lw*(nbr_of_lanes_start/2 -0.5 - counter_s)*np.sin(h),
-                                y0 - lw*(nbr_of_lanes_start/2 -0.5 - counter_s)*np.cos(h), h, 3)
-                laneBis = []
-                for (x,y) in lane :
-                    laneBis.append([x,y])
-
-                lanes_before.append(laneBis)
-                counter_s -= 1
+            offsets = lw*(nbr_of_lanes_start/2 -0.5 - np.arange(nbr_of_lanes_start))
+            lanes_before = list(Straight(x0, y0, h, 3).sample_lanes(offsets))
 
 
             # now we reverse the lanes driving backwards
@@ -882,18 +855,8 @@ class AdapterRoad(Road):
 
             # then we create the lanes just after the change
 
-            counter = 0
-
-            while counter < nbr_of_lanes_end :
-                lane = Straight( x0 + (l-3)*np.cos(h) - lw*(nbr_of_lanes_start/2 -0.5 -counter-lo_left)*np.sin(h),
-                                y0 + (l-3)*np.sin(h) + lw*(nbr_of_lanes_start/2 -0.5 -counter-lo_left)*np.cos(h), h, 3)
-                counter += 1
-
-                laneBis = []
-                for (x,y) in lane :
-                    laneBis.append([x,y])
-
-                lanes_after.append(laneBis)
+            offsets = lw*(nbr_of_lanes_start/2 -0.5 - np.arange(nbr_of_lanes_end) - lo_left)
+            lanes_after = list(Straight(x0 + (l-3)*np.cos(h), y0 + (l-3)*np.sin(h), h, 3).sample_lanes(offsets))
 
             # now we reverse the lanes driving backwards
 
@@ -918,21 +881,10 @@ class AdapterRoad(Road):
                                     y0 + (l/2)*np.sin(h) - lw*(-offset_center+lo_right-1)*np.cos(h), h, l/2))
 
 
-            lanes_before=[]
-            lanes_after=[]
-            counter_s = nbr_of_lanes_start -1
-
-            # here we create the lanes juste before the change
+            # here we create the lanes juste before the change, all at once from the leftmost one
 
-            while counter_s > -1 :
-                lane = Straight( x0 + lw*(nbr_of_lanes_start/2 -0.5 - counter_s)*np.sin(h),
-                                y0 - lw*(nbr_of_lanes_start/2 -0.5 - counter_s)*np.cos(h), h, 3)
-                laneBis = []
-                for (x,y) in lane :
-                    laneBis.append([x,y])
-
-                lanes_before.append(laneBis)
-                counter_s -= 1
+            offsets = lw*(nbr_of_lanes_start/2 -0.5 - np.arange(nbr_of_lanes_start))
+            lanes_before = list(Straight(x0, y0, h, 3).sample_lanes(offsets))
 
 
             # now we reverse the lanes driving backwards
@@ -943,18 +895,8 @@ class AdapterRoad(Road):
 
             # then we create the lanes just after the change
 
-            counter = 0
-
-            while counter < nbr_of_lanes_end :
-                lane = Straight( x0 + (l-3)*np.cos(h) - lw*(nbr_of_lanes_start/2 -0.5 -counter+lo_left)*np.sin(h),
-                                y0 + (l-3)*np.sin(h) + lw*(nbr_of_lanes_start/2 -0.5 -counter+lo_left)*np.cos(h), h, 3)
-                counter += 1
-
-                laneBis = []
-                for (x,y) in lane :
-                    laneBis.append([x,y])
-
-                lanes_after.append(laneBis)
+            offsets = lw*(nbr_of_lanes_start/2 -0.5 - np.arange(nbr_of_lanes_end) + lo_left)
+            lanes_after = list(Straight(x0 + (l-3)*np.cos(h), y0 + (l-3)*np.sin(h), h, 3).sample_lanes(offsets))
 
             # now we reverse the lanes driving backwards
             for k in range (nbr_of_lanes_end-lanes_in_x_dir_end) :
@@ -966,24 +908,8 @@ class AdapterRoad(Road):
             self.e2.append(Straight( x0 + lw*(nbr_of_lanes_start/2)*np.sin(h),
                                     y0 - lw*(nbr_of_lanes_start/2)*np.cos(h), h, l))
 
-            lanes_total=[]
-            counter_s = nbr_of_lanes_start -1
-
-            while counter_s > -1 :
-                lane = Straight( x0 + lw*(nbr_of_lanes_start/2 -0.5 - counter_s)*np.sin(h),
-                                y0 - lw*(nbr_of_lanes_start/2 -0.5 - counter_s)*np.cos(h), h, l)
-                laneBis = []
-                for (x,y) in lane :
-                    laneBis.append([x,y])
-
-                lanes_total.append(laneBis)
-                counter_s -= 1
-
-            for k in range (nbr_of_lanes_start - lanes_in_x_dir_start) :
-                lanes_total[k]=lanes_total[k][::-1]
-
-            for k in range (nbr_of_lanes_start):
-                self.l.append(lanes_total[k])
+            offsets = lw*(nbr_of_lanes_start/2 -0.5 - np.arange(nbr_of_lanes_start))
+            self.add_lanes(self.c[0].sample_lanes(offsets), nbr_of_lanes_start - lanes_in_x_dir_start)
 
             return None
 
@@ -1030,7 +956,7 @@ class AdapterRoad(Road):
                 l2 = Curve(xs2, ys2, 0)
                 Current_Lane1 = []
                 counter_addLine = -1
-                for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                     if counter_addLine>-1 :
                         if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                             Current_Lane1.append([x, y])
@@ -1042,7 +968,7 @@ class AdapterRoad(Road):
 
                 Current_Lane1 = []
                 counter_addLine = -1
-                for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                     if counter_addLine>-1 :
                         if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                             Current_Lane1.append([x, y])
@@ -1104,7 +1030,7 @@ class AdapterRoad(Road):
                     l2 = Curve(xs2, ys2, 0)
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1116,7 +1042,7 @@ class AdapterRoad(Road):
 
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1151,7 +1077,7 @@ class AdapterRoad(Road):
                     l2 = Curve(xs2, ys2, 0)
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1163,7 +1089,7 @@ class AdapterRoad(Road):
 
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1218,7 +1144,7 @@ class AdapterRoad(Road):
                     l2 = Curve(xs2, ys2, 0)
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1230,7 +1156,7 @@ class AdapterRoad(Road):
 
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1267,7 +1193,7 @@ class AdapterRoad(Road):
                     l2 = Curve(xs2, ys2, 0)
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1279,7 +1205,7 @@ class AdapterRoad(Road):
 
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1316,7 +1242,7 @@ class AdapterRoad(Road):
                     l2 = Curve(xs2, ys2, 0)
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1328,7 +1254,7 @@ class AdapterRoad(Road):
 
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1366,7 +1292,7 @@ class AdapterRoad(Road):
                 l2 = Curve(xs2, ys2, 0)
                 Current_Lane1 = []
                 counter_addLine = -1
-                for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                     if counter_addLine>-1 :
                         if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                             Current_Lane1.append([x, y])
@@ -1378,7 +1304,7 @@ class AdapterRoad(Road):
 
                 Current_Lane1 = []
                 counter_addLine = -1
-                for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                     if counter_addLine>-1 :
                         if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                             Current_Lane1.append([x, y])
@@ -1426,7 +1352,7 @@ class AdapterRoad(Road):
                     l2 = Curve(xs2, ys2, 0)
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1438,7 +1364,7 @@ class AdapterRoad(Road):
 
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1475,7 +1401,7 @@ class AdapterRoad(Road):
                     l2 = Curve(xs2, ys2, 0)
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1487,7 +1413,7 @@ class AdapterRoad(Road):
 
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1531,7 +1457,7 @@ class AdapterRoad(Road):
                     l2 = Curve(xs2, ys2, 0)
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1543,7 +1469,7 @@ class AdapterRoad(Road):
 
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1581,7 +1507,7 @@ class AdapterRoad(Road):
                     l2 = Curve(xs2, ys2, 0)
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1593,7 +1519,7 @@ class AdapterRoad(Road):
 
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1629,7 +1555,7 @@ class AdapterRoad(Road):
                     l2 = Curve(xs2, ys2, 0)
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l1.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1641,7 +1567,7 @@ class AdapterRoad(Road):
 
                     Current_Lane1 = []
                     counter_addLine = -1
-                    for (x,y) in l2: #we add the new lane but we check in the same time that 2 points aren't the same
+                    for (x,y) in l2.sample(): #we add the new lane but we check in the same time that 2 points aren't the same
                         if counter_addLine>-1 :
                             if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
                                 Current_Lane1.append([x, y])
@@ -1673,11 +1599,12 @@ class EntryRoad(Road):
     #@param RefS A float. The reference speed.
     #@param Stl List of lists contening relevant points (3 points per list) describing a stopline. Base components are floats.
     #@param cw List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base components are floats.
-    def __init__(self, id, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, entry_road_angle, apron_length, side_road_length, SpeedL, RefS, Stl, cw):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, entry_road_angle, apron_length, side_road_length, SpeedL, RefS, Stl, cw, lazy=False):
 
         # General Init
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The reference speed
@@ -1688,6 +1615,11 @@ class EntryRoad(Road):
         self.crosswalk = cw
         ##A float. Represents the speed that the road has per default (defined by the speedprofile in the Road Class)
         self.DefinedSpeed = self.SpeedProfil[6]
+        self.defer_geometry(x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, entry_road_angle, apron_length)
+
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, entry_road_angle, apron_length):
         apron_length2=(apron_length*np.tan(entry_road_angle)+lw/2)/(np.tan(entry_road_angle))
 
         # Edges, Center Line and Lanes
@@ -1715,12 +1647,9 @@ class EntryRoad(Road):
             #                 __ /
             #              _/
 
-        lwi=(nbr_of_lanes -1) * lw/2
-        for _ in range(nbr_of_lanes-1):
-            self.l.append(Straight( x0 + lwi * np.cos(h + np.pi / 2),
-                                    y0 + lwi * np.sin(h + np.pi / 2),
-                                    h, l))
-            lwi -= lw
+        offsets = (nbr_of_lanes - 1) * lw / 2 - lw * np.arange(nbr_of_lanes - 1)
+        lanes = list(self.c[0].sample_lanes(offsets))
+        lwi = -(nbr_of_lanes - 1) * lw / 2
 
 
 
@@ -1736,25 +1665,19 @@ class EntryRoad(Road):
         #           (3) -/ __ /
         #              ___/
 
-        self.l.append(Straight( x0 + lwi * np.cos(h + np.pi / 2),
+        lanes.append(Straight( x0 + lwi * np.cos(h + np.pi / 2),
                                 y0 + lwi * np.sin(h + np.pi / 2),
-                                h, apron_length2))              # Here we create (1)
-        self.l.append(Straight( x0 + lwi * np.cos(h + np.pi / 2) + apron_length2 * np.cos(h),
+                                h, apron_length2).sample())              # Here we create (1)
+        lanes.append(Straight( x0 + lwi * np.cos(h + np.pi / 2) + apron_length2 * np.cos(h),
                                 y0 + lwi * np.sin(h + np.pi / 2) + apron_length2 * np.sin(h),
-                                h, l-apron_length2))   # Then (2)
+                                h, l-apron_length2).sample())   # Then (2)
 
-        self.l.append(Straight( x0 + (apron_length*np.tan(entry_road_angle)-lwi+lw/2)*np.sin(h),
+        lanes.append(Straight( x0 + (apron_length*np.tan(entry_road_angle)-lwi+lw/2)*np.sin(h),
                                 y0 - (apron_length*np.tan(entry_road_angle)-lwi+lw/2)*np.cos(h),   # And finally (3)
-                                entry_road_angle+h, (apron_length*np.tan(entry_road_angle)+lw/2)/np.sin(entry_road_angle)))
+                                entry_road_angle+h, (apron_length*np.tan(entry_road_angle)+lw/2)/np.sin(entry_road_angle)).sample())
 
         #This changes the direction of the lanes that drive backwards
-        if nbr_of_lanes-lanes_going_OUT>0:
-            for i in range(nbr_of_lanes-lanes_going_OUT):
-                l=[]
-                for (x, y) in self.l[i]:
-                    l.append([x, y])
-                l = l[::-1]
-                self.l[i] = l
+        self.add_lanes(lanes, nbr_of_lanes - lanes_going_OUT)
 
 ##This a representation of an exit road in Prescan.
 class ExitRoad(Road):
@@ -1776,11 +1699,12 @@ class ExitRoad(Road):
     #@param RefS A float. The reference speed
     #@param Stl List of lists contening relevant points (3 points per list) describing a stopline
     #@param cw List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base componemts are floats.
-    def __init__(self, id, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, exit_road_angle, apron_length, side_road_length, SpeedL, RefS, Stl, cw):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, exit_road_angle, apron_length, side_road_length, SpeedL, RefS, Stl, cw, lazy=False):
 
         # General Init
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The reference speed
@@ -1791,6 +1715,11 @@ class ExitRoad(Road):
         self.crosswalk = cw
         ##A float. Represents the speed that the road has per default (defined by the speedprofile in the Road Class)
         self.DefinedSpeed = self.SpeedProfil[7]
+        self.defer_geometry(x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, exit_road_angle, apron_length)
+
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, h, l, lw, nbr_of_lanes, lanes_going_OUT, exit_road_angle, apron_length):
         apron_length2=(apron_length*np.tan(exit_road_angle)+lw/2)/(np.tan(exit_road_angle))
 
         # Edges, Center Line and Lanes
@@ -1853,11 +1782,7 @@ class ExitRoad(Road):
         #This changes the direction of the lanes that drive backwards
         if nbr_of_lanes-lanes_going_OUT>0:
             for i in range(nbr_of_lanes-lanes_going_OUT):
-                l=[]
-                for (x, y) in self.l[i]:
-                    l.append([x, y])
-                l = l[::-1]
-                self.l[i] = l
+                self.l[i] = self.l[i].sample()[::-1]
 
 
 ##This a representation of an xcrossing road in Prescan. Each road contains one segment for each arm of the xcrossing.
@@ -1882,11 +1807,12 @@ class XCrossRoad(Road):
     #@param Stl List of lists contening relevant points (3 points per list) describing a stopline. Base components are floats.
     #@param cw List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base components are floats.
 
-    def __init__(self, id, x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_going_OUT, cs_l, SpeedL, RefS, Stl, cw):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_going_OUT, cs_l, SpeedL, RefS, Stl, cw, lazy=False):
 
         # General Init
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The reference speed
@@ -1902,6 +1828,11 @@ class XCrossRoad(Road):
         ##List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base components are floats.
         self.crosswalk = cw
 
+        self.defer_geometry(x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_going_OUT, cs_l)
+
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_going_OUT, cs_l):
         # Lanes Creation
 
         # Creation of each "Starting Lane"
@@ -1921,7 +1852,7 @@ class XCrossRoad(Road):
                 l1 = Straight(x0 + (cs_l[c]-cs_len_till_stop[c]-1)*np.cos(cs_h[c]+h) + (lwi)*np.cos(cs_h[c]+h+ np.pi / 2), y0 + (cs_l[c]-cs_len_till_stop[c]-1)*np.sin(cs_h[c]+h) + (lwi)*np.sin(cs_h[c]+h+ np.pi / 2), cs_h[c]+h, (cs_len_till_stop[c]+1))
 
                 Current_Lane = []  # This convert the lane from a path obj to a tab of point
-                for (x,y) in l1:
+                for (x,y) in l1.sample():
                     Current_Lane.append([x, y])
 
                 self.l.append(Current_Lane[1:])
@@ -2010,6 +1941,9 @@ class XCrossRoad(Road):
 
         count_lanes_going_IN =0
 
+        # The lanes are converted once to arrays of points, which are shared by all the connections made from them
+        lane_arrays = [np.asarray(lane, dtype=float) for lane in self.l]
+
 
         for m in range(4):  # For each Branch of the X Crossing
             if Number_of_lanes_going_IN[m] !=0 :  # if there are lanes going in the opposite x direction
@@ -2021,7 +1955,7 @@ class XCrossRoad(Road):
 
                 lanes_going_IN = []
                 for k in range (len(Index_lanes_going_in[m])):
-                    lanes_going_IN.append(self.l[Index_lanes_going_in[m][k]])  # Lanes going in the crossroad that we will link to the roads going out of the crossroad
+                    lanes_going_IN.append(lane_arrays[Index_lanes_going_in[m][k]])  # Lanes going in the crossroad that we will link to the roads going out of the crossroad
 
 
                 Lane_available_for_connection = []
@@ -2030,7 +1964,7 @@ class XCrossRoad(Road):
                 for p in range(4):
                     if p != m :
                         for k in range (len(Index_lanes_going_out[p])) :
-                            Lane_available_for_connection.append(self.l[Index_lanes_going_out[p][k]])
+                            Lane_available_for_connection.append(lane_arrays[Index_lanes_going_out[p][k]])
 
 
 
@@ -2039,48 +1973,7 @@ class XCrossRoad(Road):
 
                     for r in range(len(Lane_available_for_connection)): # We connect the Only Lane of interest to EVERY lane avaible for conections
 
-                        (x1,y1) = lanes_going_IN[0][len(lanes_going_IN[0])-1]
-
-                        (x2,y2) = Lane_available_for_connection[r][0]
-
-                        (x3,y3) = Intersection_Lines(lanes_going_IN[0],Lane_available_for_connection[r])
-
-                        # here we check if (x3,y3) is on lanes_going_IN[0] (or Lane_available_for_connection[r])
-                        # if it is, (x1,y1) (or (x3,y3)) will be the point after (respectively the point before) on the lanes
-                        # so that the curve created will be smoother
-
-                        k2=0
-                        while k2<len(Lane_available_for_connection[r]) :
-                            p2 = Lane_available_for_connection[r][k2]
-                            if dist(p2,(x3,y3))<0.5 :
-                                (x2,y2) = Lane_available_for_connection[r][k2+1]
-                                k2=len(Lane_available_for_connection[r])
-                            k2+=1
-
-                        k1=len(lanes_going_IN[0])-1
-                        while k1>0 :
-                            p1 = lanes_going_IN[0][k1]
-                            if dist(p1,(x3,y3))<0.5 :
-                                (x1,y1) = lanes_going_IN[0][k1-1]
-                                k1=-1
-                            k1=k1-1
-
-
-                        xs = [x1, x3, x3, x2]
-                        ys = [y1, y3, y3, y2]
-
-                        l1 = Curve(xs, ys, 0)
-                        Current_Lane1 = []
-                        counter_addLine = -1
-                        for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
-                            if counter_addLine>-1 :
-                                if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
-                                    Current_Lane1.append([x, y])
-                                    counter_addLine+=1
-                            else :
-                                Current_Lane1.append([x, y])
-                                counter_addLine+=1
-                        self.l.append(Current_Lane1)
+                        self.l.append(self.connect_lanes(lanes_going_IN[0], Lane_available_for_connection[r], len(lanes_going_IN[0])))
 
 
                 else :
@@ -2135,43 +2028,7 @@ class XCrossRoad(Road):
 
                         for j in range(len(Lane_available_for_connection_right)):
 
-                            (x1,y1) = lanes_going_IN_right[q][len(lanes_going_IN_right[q])-1]
-
-                            (x2,y2) = Lane_available_for_connection_right[j][0]
-
-                            (x3,y3) = Intersection_Lines(lanes_going_IN_right[q], Lane_available_for_connection_right[j])
-
-                            k2=0
-                            while k2<len(Lane_available_for_connection_right[j]) :
-                                p2 = Lane_available_for_connection_right[j][k2]
-                                if dist(p2,(x3,y3))<0.5 :
-                                    (x2,y2) = Lane_available_for_connection_right[j][k2+1]
-                                    k2=len(Lane_available_for_connection_right[j])
-                                k2+=1
-
-                            k1=len(lanes_going_IN_right[0])-1
-                            while k1>0 :
-                                p1 = lanes_going_IN_right[q][k1]
-                                if dist(p1,(x3,y3))<0.5 :
-                                    (x1,y1) = lanes_going_IN_right[q][k1-1]
-                                    k1=-1
-                                k1=k1-1
-
-                            xs = [x1, x3, x3, x2]
-                            ys = [y1, y3, y3, y2]
-
-                            l1 = Curve(xs, ys, 0)
-                            Current_Lane1 = []
-                            counter_addLine = -1
-                            for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
-                                if counter_addLine>-1 :
-                                    if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
-                                        Current_Lane1.append([x, y])
-                                        counter_addLine+=1
-                                else :
-                                    Current_Lane1.append([x, y])
-                                    counter_addLine+=1
-                            self.l.append(Current_Lane1)
+                            self.l.append(self.connect_lanes(lanes_going_IN_right[q], Lane_available_for_connection_right[j], len(lanes_going_IN_right[0])))
 
 
 
@@ -2181,44 +2038,7 @@ class XCrossRoad(Road):
                         # Same working but for the left
                         for j in range(len(Lane_available_for_connection_left)):
 
-                            (x1,y1) = lanes_going_IN_left[q][len(lanes_going_IN_left[q])-1]
-
-                            (x2,y2) = Lane_available_for_connection_left[j][0]
-
-                            (x3,y3) = Intersection_Lines(lanes_going_IN_left[q], Lane_available_for_connection_left[j])
-
-                            k2=0
-                            while k2<len(Lane_available_for_connection_left[j]) :
-                                p2 = Lane_available_for_connection_left[j][k2]
-                                if dist(p2,(x3,y3))<0.5 :
-                                    (x2,y2) = Lane_available_for_connection_left[j][k2+1]
-                                    k2=len(Lane_available_for_connection_left[j])
-                                k2+=1
-
-                            k1=len(lanes_going_IN_left[0])-1
-                            while k1>0 :
-                                p1 = lanes_going_IN_left[q][k1]
-                                if dist(p1,(x3,y3))<0.5 :
-                                    (x1,y1) = lanes_going_IN_left[q][k1-1]
-                                    k1=-1
-                                k1=k1-1
-
-                            xs = [x1, x3, x3, x2]
-                            ys = [y1, y3, y3, y2]
-
-
-                            l1 = Curve(xs, ys, 0)
-                            Current_Lane1 = []
-                            counter_addLine = -1
-                            for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
-                                if counter_addLine>-1 :
-                                    if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
-                                        Current_Lane1.append([x, y])
-                                        counter_addLine+=1
-                                else :
-                                    Current_Lane1.append([x, y])
-                                    counter_addLine+=1
-                            self.l.append(Current_Lane1)
+                            self.l.append(self.connect_lanes(lanes_going_IN_left[q], Lane_available_for_connection_left[j], len(lanes_going_IN_left[0])))
 
 
 
@@ -2264,11 +2084,12 @@ class YCrossRoad(Road):
     #@param Stl List of lists contening relevant points (3 points per list) describing a stopline. Base components are floats.
     #@param cw List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base components are floats.
 
-    def __init__(self, id, x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_going_OUT, cs_l, SpeedL, RefS, Stl, cw):
+    #@param lazy A boolean. True to compute the geometry of the road only when it is first used (see Road.defer_geometry)
+    def __init__(self, id, x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_going_OUT, cs_l, SpeedL, RefS, Stl, cw, lazy=False):
 
         # General Init
 
-        Road.__init__(self, id)
+        Road.__init__(self, id, lazy)
         ##A float. The speed limit
         self.SpeedLimit = SpeedL
         ##A float. The reference speed
@@ -2284,6 +2105,11 @@ class YCrossRoad(Road):
         ##List of lists contening relevant points (3 points per list) describing the 3 lines describing a crosswalk. Base components are floats.
         self.crosswalk = cw
 
+        self.defer_geometry(x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_going_OUT, cs_l)
+
+    ##This method computes the lanes, the center and the edges of the road (see Road.defer_geometry)
+    #@param self The object pointer
+    def build_geometry(self, x0, y0, h, lw, cs_h, cs_len_till_stop, cs_nbr_of_lanes, cs_lanes_going_OUT, cs_l):
         # Lanes Creation
 
         # Creation of each "Starting Lane"
@@ -2303,7 +2129,7 @@ class YCrossRoad(Road):
                 l1 = Straight(x0 + (cs_l[c]-cs_len_till_stop[c]-1)*np.cos(cs_h[c]+h) + (lwi)*np.cos(cs_h[c]+h+ np.pi / 2), y0 + (cs_l[c]-cs_len_till_stop[c]-1)*np.sin(cs_h[c]+h) + (lwi)*np.sin(cs_h[c]+h+ np.pi / 2), cs_h[c]+h, (cs_len_till_stop[c]+1))
 
                 Current_Lane = []  # This convert the lane from a path obj to a tab of point
-                for (x,y) in l1:
+                for (x,y) in l1.sample():
                     Current_Lane.append([x, y])
 
                 self.l.append(Current_Lane[1:])
@@ -2390,6 +2216,9 @@ class YCrossRoad(Road):
 
         count_lanes_going_IN =0
 
+        # The lanes are converted once to arrays of points, which are shared by all the connections made from them
+        lane_arrays = [np.asarray(lane, dtype=float) for lane in self.l]
+
         for m in range(3): # For each corssections
 
             # We will proceed by doing two list for each crossection :
@@ -2420,7 +2249,7 @@ class YCrossRoad(Road):
 
                 lanes_going_IN = []
                 for k in range (len(Index_lanes_going_in[m])):
-                    lanes_going_IN.append(self.l[Index_lanes_going_in[m][k]])  # Lanes going in the crossroad that we will link to the roads going out of the crossroad
+                    lanes_going_IN.append(lane_arrays[Index_lanes_going_in[m][k]])  # Lanes going in the crossroad that we will link to the roads going out of the crossroad
 
 
                 Lane_available_for_connection = []
@@ -2429,7 +2258,7 @@ class YCrossRoad(Road):
                 for p in range(3):
                     if p != m :
                         for k in range (len(Index_lanes_going_out[p])) :
-                            Lane_available_for_connection.append(self.l[Index_lanes_going_out[p][k]])
+                            Lane_available_for_connection.append(lane_arrays[Index_lanes_going_out[p][k]])
 
 
 
@@ -2438,48 +2267,7 @@ class YCrossRoad(Road):
 
                     for r in range(len(Lane_available_for_connection)): # We connect the Only Lane of interest to EVERY lane avaible for conections
 
-                        (x1,y1) = lanes_going_IN[0][len(lanes_going_IN[0])-1]
-
-                        (x2,y2) = Lane_available_for_connection[r][0]
-
-                        (x3,y3) = Intersection_Lines(lanes_going_IN[0],Lane_available_for_connection[r])
-
-                        # here we check if (x3,y3) is on lanes_going_IN[0] or Lane_available_for_connection[r]
-                        # if it is, (x1,y1) (or (x3,y3)) will be the point after (respectively the point before) on the lanes
-                        # so that the curve created will be smoother
-
-                        k2=0
-                        while k2<len(Lane_available_for_connection[r]) :
-                            p2 = Lane_available_for_connection[r][k2]
-                            if dist(p2,(x3,y3))<0.5 :
-                                (x2,y2) = Lane_available_for_connection[r][k2+1]
-                                k2=len(Lane_available_for_connection[r])
-                            k2+=1
-
-                        k1=len(lanes_going_IN[0])-1
-                        while k1>0 :
-                            p1 = lanes_going_IN[0][k1]
-                            if dist(p1,(x3,y3))<0.5 :
-                                (x1,y1) = lanes_going_IN[0][k1-1]
-                                k1=-1
-                            k1=k1-1
-
-
-                        xs = [x1, x3, x3, x2]
-                        ys = [y1, y3, y3, y2]
-
-                        l1 = Curve(xs, ys, 0)
-                        Current_Lane1 = []
-                        counter_addLine = -1
-                        for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
-                            if counter_addLine>-1 :
-                                if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
-                                    Current_Lane1.append([x, y])
-                                    counter_addLine+=1
-                            else :
-                                Current_Lane1.append([x, y])
-                                counter_addLine+=1
-                        self.l.append(Current_Lane1)
+                        self.l.append(self.connect_lanes(lanes_going_IN[0], Lane_available_for_connection[r], len(lanes_going_IN[0])))
 
 
                 else :
@@ -2534,43 +2322,7 @@ class YCrossRoad(Road):
 
                         for j in range(len(Lane_available_for_connection_right)):
 
-                            (x1,y1) = lanes_going_IN_right[q][len(lanes_going_IN_right[q])-1]
-
-                            (x2,y2) = Lane_available_for_connection_right[j][0]
-
-                            (x3,y3) = Intersection_Lines(lanes_going_IN_right[q], Lane_available_for_connection_right[j])
-
-                            k2=0
-                            while k2<len(Lane_available_for_connection_right[j]) :
-                                p2 = Lane_available_for_connection_right[j][k2]
-                                if dist(p2,(x3,y3))<0.5 :
-                                    (x2,y2) = Lane_available_for_connection_right[j][k2+1]
-                                    k2=len(Lane_available_for_connection_right[j])
-                                k2+=1
-
-                            k1=len(lanes_going_IN_right[0])-1
-                            while k1>0 :
-                                p1 = lanes_going_IN_right[q][k1]
-                                if dist(p1,(x3,y3))<0.5 :
-                                    (x1,y1) = lanes_going_IN_right[q][k1-1]
-                                    k1=-1
-                                k1=k1-1
-
-                            xs = [x1, x3, x3, x2]
-                            ys = [y1, y3, y3, y2]
-
-                            l1 = Curve(xs, ys, 0)
-                            Current_Lane1 = []
-                            counter_addLine = -1
-                            for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
-                                if counter_addLine>-1 :
-                                    if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
-                                        Current_Lane1.append([x, y])
-                                        counter_addLine+=1
-                                else :
-                                    Current_Lane1.append([x, y])
-                                    counter_addLine+=1
-                            self.l.append(Current_Lane1)
+                            self.l.append(self.connect_lanes(lanes_going_IN_right[q], Lane_available_for_connection_right[j], len(lanes_going_IN_right[0])))
 
 
 
@@ -2580,44 +2332,7 @@ class YCrossRoad(Road):
                         # Same working but for the left
                         for j in range(len(Lane_available_for_connection_left)):
 
-                            (x1,y1) = lanes_going_IN_left[q][len(lanes_going_IN_left[q])-1]
-
-                            (x2,y2) = Lane_available_for_connection_left[j][0]
-
-                            (x3,y3) = Intersection_Lines(lanes_going_IN_left[q], Lane_available_for_connection_left[j])
-
-                            k2=0
-                            while k2<len(Lane_available_for_connection_left[j]) :
-                                p2 = Lane_available_for_connection_left[j][k2]
-                                if dist(p2,(x3,y3))<0.5 :
-                                    (x2,y2) = Lane_available_for_connection_left[j][k2+1]
-                                    k2=len(Lane_available_for_connection_left[j])
-                                k2+=1
-
-                            k1=len(lanes_going_IN_left[0])-1
-                            while k1>0 :
-                                p1 = lanes_going_IN_left[q][k1]
-                                if dist(p1,(x3,y3))<0.5 :
-                                    (x1,y1) = lanes_going_IN_left[q][k1-1]
-                                    k1=-1
-                                k1=k1-1
-
-                            xs = [x1, x3, x3, x2]
-                            ys = [y1, y3, y3, y2]
-
-
-                            l1 = Curve(xs, ys, 0)
-                            Current_Lane1 = []
-                            counter_addLine = -1
-                            for (x,y) in l1: #we add the new lane but we check in the same time that 2 points aren't the same
-                                if counter_addLine>-1 :
-                                    if (round(x,4),round(y,4)) != (round(Current_Lane1[counter_addLine][0],4),round(Current_Lane1[counter_addLine][1],4)) :
-                                        Current_Lane1.append([x, y])
-                                        counter_addLine+=1
-                                else :
-                                    Current_Lane1.append([x, y])
-                                    counter_addLine+=1
-                            self.l.append(Current_Lane1)
+                            self.l.append(self.connect_lanes(lanes_going_IN_left[q], Lane_available_for_connection_left[j], len(lanes_going_IN_left[0])))
 
 
 
@@ -54,3 +54,52 @@ class TrafficLight(StaticObject):
         self.s = s
 
 
+##This a representation of a Traffic Sign in Prescan (stop sign, speed sign and so on...).
+class TrafficSign(StaticObject):
+
+    ##The constructor
+    #@param self The object pointer
+    #@param id A string. The id of the object
+    #@param x0 A Float. The x coordinate of orign of the Traffic Sign
+    #@param y0 A Float. The y coordinate of orign of the Traffic Sign
+    #@param h A Float. Heading of the Traffic Sign
+    #@param description A string. The description of the sign in the pex file
+    def __init__(self, id, x0, y0, h, description):
+        StaticObject.__init__(self, id)
+        ##A Float. The x coordinate of orign of the Traffic Sign
+        self.x0 = x0
+        ##A Float. The y coordinate of orign of the Traffic Sign
+        self.y0 = y0
+        ##A Float. Heading of the Traffic Sign
+        self.h = h
+        ##A string. The description of the sign in the pex file, which tells what the sign is
+        self.description = description
+
+##A dictionary of the statical objects indexed by their id, which also keeps them grouped by type (TrafficLight, TrafficSign...)
+#so that the objects of one type are found without looking at all of them.
+class StaticObjectIndex(dict):
+
+    ##The constructor
+    #@param self The object pointer
+    def __init__(self):
+        dict.__init__(self)
+        ##A dictionary mapping each type to the list of the statical objects of this type, in the order they were added
+        self.types = {}
+
+    ##This method adds a statical object to the index
+    #@param self The object pointer
+    #@param type A string. The type of the object
+    #@param staticobject A StaticObject object
+    def add(self, type, staticobject):
+        if staticobject.id in self:
+            for objects in self.types.values():
+                if self[staticobject.id] in objects:
+                    objects.remove(self[staticobject.id])
+        self[staticobject.id] = staticobject
+        self.types.setdefault(type, []).append(staticobject)
+
+    ##This method returns the list of the statical objects of a type
+    #@param self The object pointer
+    #@param type A string. The type of the objects
+    def get_type(self, type):
+        return self.types.get(type, [])
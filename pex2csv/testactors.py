@@ -0,0 +1,39 @@
+##@package testactors
+#This file checks the type that parse.py gives to the Actors of a pex file from their Description (see get_actor_type).
+#It can be run as a script or with pytest.
+
+from lxml import etree
+import parse
+
+##The Descriptions of PreScan Actors and the type they must be given, None for the Actors that are not read
+DESCRIPTIONS = (
+    ('TrafficLight_Roadside', 'TrafficLight'),
+    ('RoadsideTrafficLight', 'TrafficLight'),
+    ('Roadside_NL', 'TrafficLight'),
+    ('Roadside traffic light', 'TrafficLight'),
+    ('roadside tree', None),
+    ('Traffic light with roadside pole', None),
+    ('Stop sign', 'TrafficSign'),
+    ('Sign_Stop', 'TrafficSign'),
+    ('Road signs', 'TrafficSign'),
+    ('SIGN 30', 'TrafficSign'),
+    ('Design element', None),
+    ('Signal post', None),
+    ('Audi_A8_Sedan', None),
+    ('', None),
+)
+
+##This function checks the type of an Actor with each Description of DESCRIPTIONS
+def test_actor_type():
+    for description, type in DESCRIPTIONS:
+        actor = etree.Element('Actor', Description=description)
+        assert parse.get_actor_type(actor) == type, description
+
+##This function checks that an Actor without Description is not read
+def test_actor_without_description():
+    assert parse.get_actor_type(etree.Element('Actor')) is None
+
+if __name__ == '__main__':
+    test_actor_type()
+    test_actor_without_description()
+    print('ok')
@@ -0,0 +1,49 @@
+##@package testlanes
+#This file checks the simplification of the lanes by preproc.py (see utils.resample_line).
+#It can be run as a script or with pytest.
+
+import numpy as np
+from path import Bend, Straight
+from preproc import RoadProcessor
+from utils import dist, distance_to_segment, resample_line
+
+##This function checks that a long straight lane keeps far fewer points, at most max_spacing apart
+def test_straight():
+    points = np.array(list(Straight(0.0, 0.0, 0.3, 200.0)))
+    assert len(resample_line(points, 0.0, 10.0)) == len(points)
+    kept = resample_line(points, 0.05, 10.0)
+    assert len(kept) < len(points) / 5
+    assert np.allclose(kept[0], points[0]) and np.allclose(kept[-1], points[-1])
+    assert max(dist(kept[i], kept[i + 1]) for i in range(len(kept) - 1)) <= 10.0
+
+##This function checks that the points of a bend stay within the tolerance of the kept chords
+def test_bend():
+    points = np.array(list(Bend(0.0, 0.0, 0.0, np.pi / 2, 30.0)))
+    kept = resample_line(points, 0.1, 20.0)
+    assert len(kept) < len(points)
+    for p1, p2 in zip(kept[:-1], kept[1:]):
+        i1 = np.flatnonzero((points == p1).all(axis=1))[0]
+        i2 = np.flatnonzero((points == p2).all(axis=1))[0]
+        assert distance_to_segment(points[i1 + 1:i2], p1, p2) <= 0.1
+
+##This function checks that the fixed points are kept
+def test_fixed():
+    points = np.array(list(Straight(0.0, 0.0, 0.0, 100.0)))
+    kept = resample_line(points, 0.05, 50.0, [37, 38])
+    assert [0.0, 37.0, 38.0, 88.0, 100.0] == list(np.round(kept[:, 0], 6))
+
+##This function checks that a turn point inserted in a lane is kept by the simplification of the lanes
+def test_turn_point():
+    processor = RoadProcessor({}, 0.05, 20.0)
+    turn = (42.5, 0.3)
+    processor._RoadProcessor__add_lane(50, 50, 50, Straight(0.0, 0.0, 0.0, 100.0), rturns=[turn])
+    lane = processor.lanes[0].lanes
+    assert list(turn) in lane
+    assert len(lane) < 20
+
+if __name__ == '__main__':
+    test_straight()
+    test_bend()
+    test_fixed()
+    test_turn_point()
+    print('ok')
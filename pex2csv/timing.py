@@ -0,0 +1,77 @@
+##@package timing
+#This module contains the profile of the parser, which measures where the time is spent while a pex file is extracted.
+#It is used to find the road types that are the slowest to read and to build on large maps.
+
+import json
+import time
+import tracemalloc
+
+##A class that records the wall time, the number of calls and the peak memory of the steps of the parser.
+#The measures are grouped by step ('stages', 'readers', 'builders'), then by name (the stage, the xsi:type of the
+#RoadSegments or the class of the roads).
+class ParserProfile:
+    ##The constructor
+    #@param self The object pointer
+    #@param memory A boolean. True to also measure the peak memory of each call with tracemalloc, which slows down the parser
+    def __init__(self, memory=False):
+        ##A boolean. True if the peak memory is measured
+        self.memory = memory
+        ##A dictionary mapping each step to a dictionary of measures indexed by name
+        self.steps = {}
+        ##A list with the highest memory used so far by each call being measured, the innermost one last
+        self.peaks = []
+
+    ##This method calls a function and adds its wall time (and peak memory) to the measures of a step
+    #@param self The object pointer
+    #@param step A string. The step of the parser ('stages', 'readers' or 'builders')
+    #@param name A string. What is measured in the step, for example the xsi:type of the RoadSegment being read
+    #@param function The function to call
+    #@param args The parameters of the function
+    #@return What the function returned
+    def call(self, step, name, function, *args):
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            start = tracemalloc.get_traced_memory()[0]
+            # The peak is reset for this call, so keep the peak reached so far by the calls it is nested in
+            if self.peaks:
+                self.peaks[-1] = max(self.peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self.peaks.append(start)
+
+        t0 = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - t0
+
+        measure = self.steps.setdefault(step, {}).setdefault(name, {'calls': 0, 'time': 0.0, 'peak_memory': 0})
+        measure['calls'] += 1
+        measure['time'] += elapsed
+        if self.memory:
+            peak = max(self.peaks.pop(), tracemalloc.get_traced_memory()[1])
+            measure['peak_memory'] = max(measure['peak_memory'], peak - start)
+            if self.peaks:
+                self.peaks[-1] = max(self.peaks[-1], peak)
+        return result
+
+    ##This method stops measuring the memory, so that the rest of the program is not slowed down by tracemalloc
+    #@param self The object pointer
+    def stop(self):
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    ##This method returns the measures, with the names of each step sorted from the slowest to the fastest.
+    #Each measure is a dictionary with the number of calls, the total time in seconds and the peak memory in bytes
+    #(0 when the memory is not measured).
+    #@param self The object pointer
+    def report(self):
+        report = {}
+        for step, measures in self.steps.items():
+            report[step] = dict(sorted(measures.items(), key=lambda item: item[1]['time'], reverse=True))
+        return report
+
+    ##This method writes the report in a json file
+    #@param self The object pointer
+    #@param path A string. The path to the json file
+    def write(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=4)
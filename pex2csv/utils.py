@@ -38,6 +38,43 @@ def radius_of_circle(p1, p2, angle):
 def dist(p1, p2):
     return np.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
 
+##The nodes and weights of the Gauss-Legendre quadrature used by fresnel, moved from [-1, 1] to [0, 1]
+FRESNEL_NODES, FRESNEL_WEIGHTS = np.polynomial.legendre.leggauss(64)
+FRESNEL_NODES = (FRESNEL_NODES + 1) / 2
+FRESNEL_WEIGHTS = FRESNEL_WEIGHTS / 2
+
+##A function that returns the Fresnel integrals S(x) and C(x), the integrals from 0 to x of sin(pi*t**2/2) and cos(pi*t**2/2).
+#For |x| <= 6 they are computed with a Gauss-Legendre quadrature, and with their asymptotic expansion beyond.
+#Both are accurate to about 1e-14.
+#@param x A Float or a numpy array of Floats
+#@return A tuple (S, C) of numpy arrays with the shape of x
+def fresnel(x):
+    x = np.asarray(x, dtype=float)
+    ax = np.abs(x)
+    S = np.empty_like(ax)
+    C = np.empty_like(ax)
+
+    small = ax <= 6
+    t = ax[small, None] * FRESNEL_NODES
+    S[small] = ax[small] * (np.sin(np.pi / 2 * t**2) @ FRESNEL_WEIGHTS)
+    C[small] = ax[small] * (np.cos(np.pi / 2 * t**2) @ FRESNEL_WEIGHTS)
+
+    large = ~small
+    z = np.pi * ax[large]**2
+    f = np.zeros_like(z)
+    g = np.zeros_like(z)
+    term_f = 1 / (np.pi * ax[large])
+    term_g = term_f / z
+    for n in range(8):
+        f += term_f
+        g += term_g
+        term_f = -term_f * (4*n + 1) * (4*n + 3) / z**2
+        term_g = -term_g * (4*n + 3) * (4*n + 5) / z**2
+    S[large] = 0.5 - f * np.cos(z / 2) - g * np.sin(z / 2)
+    C[large] = 0.5 + f * np.sin(z / 2) - g * np.cos(z / 2)
+
+    return np.sign(x) * S, np.sign(x) * C
+
 ##A function that returns the point of intersection of 2 lines L1 et L2
 #@param L1 A list of 2 points representing the line
 #@param L2 A list of 2 points representing the line
@@ -187,3 +224,47 @@ def offset_point(poly,p1,p2):
             else :
                 x1 = x3
     return(p3)
+
+##A function that returns the largest distance between the points and the segment [p1, p2]
+#@param points A numpy array of shape (N, 2)
+#@param p1 A numpy array representing the first point of the segment
+#@param p2 A numpy array representing the last point of the segment
+def distance_to_segment(points, p1, p2):
+    if len(points) == 0:
+        return 0.0
+    segment = p2 - p1
+    length = segment @ segment
+    d = points - p1
+    if length == 0:
+        return np.sqrt((d**2).sum(axis=1)).max()
+    t = np.clip(d @ segment / length, 0, 1)
+    return np.sqrt(((d - t[:, None] * segment)**2).sum(axis=1)).max()
+
+##A function that removes the points of a line that are not needed to follow it within a tolerance.
+#It simplifies a line that was already sampled, it does not sample the paths again.
+#From each kept point, the next kept point is the farthest one such that it is at most max_spacing away, no fixed point is
+#skipped, and the points skipped in between are at most tolerance away from the chord joining them. The first and last points
+#are always kept, and two points that were more than max_spacing apart stay consecutive.
+#Each longer chord checks again all the points it skips, so the cost grows with the square of the number of points
+#skipped per chord, that is with the square of max_spacing over the sampling step of the line.
+#@param points A list of points [x, y] or a numpy array of shape (N, 2)
+#@param tolerance A Float. The largest distance in meters between the line and the kept chords, 0 to keep every point
+#@param max_spacing A Float. The largest distance in meters between two kept points
+#@param fixed A list of integers. The indices of the points that must be kept
+#@return A numpy array of shape (M, 2) with the kept points
+def resample_line(points, tolerance, max_spacing=1.0, fixed=()):
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    if tolerance <= 0 or n < 3:
+        return points
+    fixed = set(fixed)
+    keep = [0]
+    i = 0
+    while i < n - 1:
+        j = i + 1
+        while j + 1 < n and j not in fixed and dist(points[i], points[j + 1]) <= max_spacing \
+                and distance_to_segment(points[i + 1:j + 1], points[i], points[j + 1]) <= tolerance:
+            j += 1
+        keep.append(j)
+        i = j
+    return points[keep]